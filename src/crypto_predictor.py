@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 
 
 class CryptoPredictor:
@@ -24,6 +25,9 @@ class CryptoPredictor:
         self.db = db
         self.logger = logging.getLogger(__name__)
 
+        # Per-symbol predictions are independent DB reads, so batches run them side by side
+        self._pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="predict")
+
         # Crypto-related keywords to track
         self.crypto_keywords = {
             'bitcoin': ['bitcoin', 'btc'],
@@ -288,12 +292,7 @@ class CryptoPredictor:
         Returns:
             List of prediction dictionaries
         """
-        predictions = []
-        for symbol in symbols:
-            prediction = self.predict_price_movement(symbol, timeframe)
-            predictions.append(prediction)
-
-        return predictions
+        return list(self._pool.map(lambda symbol: self.predict_price_movement(symbol, timeframe), symbols))
 
     def get_sentiment_trend(self, symbol: str, hours: int = 24) -> Dict:
         """Analyze sentiment trend over time
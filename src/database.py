@@ -1,10 +1,43 @@
 import sqlite3
 import os
+import re
+import calendar
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import json
 
 
+# "Date: Thursday, October 16, 2025", optionally wrapped as "Date: TODAY (Thursday, October 16, 2025)"
+DATE_RE = re.compile(r'^Date:\s*(?:\w+\s*\()?([^()\n]+?)\)?\s*$', re.M)
+
+
+def _forex_message_date(message: str) -> Optional[str]:
+    """Event date from a forex alert message, or None"""
+    if not (m := DATE_RE.search(message or '')):
+        return None
+    try:
+        return datetime.strptime(m.group(1), '%A, %B %d, %Y').date().isoformat()
+    except ValueError:
+        return None
+
+
+# Hour bucket of an article's local wall-clock time, as SQLite computes it from tweets.created_at.
+# Entity rows carry it in time_bucket so window queries can range-scan an integer index first.
+_HOUR_BUCKET_SQL = "CAST(strftime('%s', datetime({created_at})) AS INTEGER) / 3600"
+
+
+def _window_bucket(hours: int) -> int:
+    """Oldest hour bucket that can hold rows newer than `hours` hours ago (local time)"""
+    return calendar.timegm(datetime.now().timetuple()) // 3600 - int(hours)
+
+
+def _raw_json(raw) -> str:
+    """JSON text for a raw payload, which may already be orjson-encoded bytes"""
+    if isinstance(raw, bytes):
+        return raw.decode('utf-8')
+    return json.dumps(raw)
+
+
 class Database:
     def __init__(self, db_path: str = "data/twitter_bot.db"):
         self.db_path = db_path
@@ -103,7 +136,8 @@ class Database:
                 message TEXT NOT NULL,
                 data TEXT,
                 sent_to_telegram BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                event_date TIMESTAMP
             )
         """)
 
@@ -140,6 +174,7 @@ class Database:
                 entity_label TEXT NOT NULL,
                 entity_count INTEGER DEFAULT 1,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                time_bucket INTEGER,
                 FOREIGN KEY (tweet_id) REFERENCES tweets(tweet_id)
             )
         """)
@@ -164,6 +199,35 @@ class Database:
         if 'url' not in columns:
             cursor.execute("ALTER TABLE tweets ADD COLUMN url TEXT")
 
+        # Migration: Add event_date column to alerts and backfill forex events from their message
+        cursor.execute("PRAGMA table_info(alerts)")
+        columns = [column[1] for column in cursor.fetchall()]
+        if 'event_date' not in columns:
+            cursor.execute("ALTER TABLE alerts ADD COLUMN event_date TIMESTAMP")
+            cursor.execute("SELECT id, message, created_at FROM alerts WHERE alert_type = 'forex_calendar'")
+            cursor.executemany(
+                "UPDATE alerts SET event_date = ? WHERE id = ?",
+                [(_forex_message_date(row['message']) or row['created_at'], row['id'])
+                 for row in cursor.fetchall()]
+            )
+
+        # Migration: Add time_bucket to entities, backfilled from each article's timestamp
+        cursor.execute("PRAGMA table_info(entities)")
+        columns = [column[1] for column in cursor.fetchall()]
+        if 'time_bucket' not in columns:
+            cursor.execute("ALTER TABLE entities ADD COLUMN time_bucket INTEGER")
+            cursor.execute(f"""
+                UPDATE entities SET time_bucket = (
+                    SELECT {_HOUR_BUCKET_SQL.format(created_at='t.created_at')}
+                    FROM tweets t WHERE t.tweet_id = entities.tweet_id
+                )
+            """)
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_bucket ON entities(time_bucket)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_label_bucket ON entities(entity_label, time_bucket)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_type_event_date ON alerts(alert_type, event_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_type_created ON alerts(alert_type, created_at DESC)")
+
         conn.commit()
         conn.close()
 
@@ -189,7 +253,7 @@ class Database:
                 tweet_data.get('reply_count', 0),
                 tweet_data.get('category'),
                 tweet_data.get('url', ''),
-                json.dumps(tweet_data.get('raw_data', {}))
+                _raw_json(tweet_data.get('raw_data', {}))
             ))
 
             conn.commit()
@@ -239,16 +303,16 @@ class Database:
             return False
 
     def insert_alert(self, alert_type: str, category: str, severity: str,
-                     message: str, data: Dict = None) -> bool:
-        """Insert an alert"""
+                     message: str, data: Dict = None, event_date: str = None) -> bool:
+        """Insert an alert (event_date is the scheduled date for calendar events)"""
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
-                INSERT INTO alerts (alert_type, category, severity, message, data)
-                VALUES (?, ?, ?, ?, ?)
-            """, (alert_type, category, severity, message, json.dumps(data) if data else None))
+                INSERT INTO alerts (alert_type, category, severity, message, data, event_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (alert_type, category, severity, message, json.dumps(data) if data else None, event_date))
 
             conn.commit()
             conn.close()
@@ -265,6 +329,14 @@ class Database:
             hours: Filter by hours (optional, if None returns all)
             limit: Maximum number of results
         """
+        return list(self.iter_recent_tweets(category=category, hours=hours, limit=limit))
+
+    def iter_recent_tweets(self, category: str = None, hours: int = None, limit: int = 100) -> Iterator[Dict]:
+        """Like get_recent_tweets, but yields rows as the cursor produces them
+
+        The query runs before this returns, so errors surface to the caller; the connection is
+        closed when iteration finishes.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -305,9 +377,14 @@ class Database:
                 LIMIT ?
             """, (limit,))
 
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return results
+        def rows():
+            try:
+                for row in cursor:
+                    yield dict(row)
+            finally:
+                conn.close()
+
+        return rows()
 
     def get_word_frequency_stats(self, category: str = None, hours: int = 24,
                                   limit: int = 50) -> List[Dict]:
@@ -370,6 +447,33 @@ class Database:
         conn.close()
         return results
 
+    def get_tweet_keywords_bulk(self, tweet_ids: List[str], hours: int = 24) -> Dict[str, List[str]]:
+        """Get keywords for many tweets in one query, keyed by tweet_id"""
+        keywords = {tweet_id: [] for tweet_id in tweet_ids}
+        if not keywords:
+            return keywords
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        ids = list(keywords)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f"""
+                SELECT DISTINCT tweet_id, word
+                FROM word_frequency
+                WHERE tweet_id IN ({placeholders})
+                AND timestamp > datetime('now', '-' || ? || ' hours')
+            """, (*chunk, hours))
+
+            for tweet_id, word in cursor.fetchall():
+                keywords[tweet_id].append(word)
+
+        conn.close()
+        return keywords
+
     def get_tweets_by_keyword(self, keyword: str, hours: int = 24, limit: int = 50) -> List[Dict]:
         """Get tweets/news articles containing a specific keyword"""
         conn = self.get_connection()
@@ -512,24 +616,44 @@ class Database:
         conn.close()
         return results
 
-    def get_alerts(self, limit: int = 50, unsent_only: bool = False) -> List[Dict]:
-        """Get recent alerts"""
+    def get_alerts(self, limit: int = 50, unsent_only: bool = False, alert_type: str = None) -> List[Dict]:
+        """Get recent alerts, optionally only unsent ones and/or of one alert_type"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
+        conditions = []
+        params = []
         if unsent_only:
-            cursor.execute("""
-                SELECT * FROM alerts
-                WHERE sent_to_telegram = 0
-                ORDER BY created_at DESC
-                LIMIT ?
-            """, (limit,))
-        else:
-            cursor.execute("""
-                SELECT * FROM alerts
-                ORDER BY created_at DESC
-                LIMIT ?
-            """, (limit,))
+            conditions.append("sent_to_telegram = 0")
+        if alert_type:
+            conditions.append("alert_type = ?")
+            params.append(alert_type)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor.execute(f"""
+            SELECT * FROM alerts
+            {where}
+            ORDER BY created_at DESC
+            LIMIT ?
+        """, (*params, limit))
+
+        results = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return results
+
+    def get_forex_alerts(self, limit: int = 50) -> List[Dict]:
+        """Get upcoming forex calendar alerts (today onwards) ordered by event date"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        # event_date holds local dates, as written by the calendar monitor
+        cursor.execute("""
+            SELECT * FROM alerts
+            WHERE alert_type = 'forex_calendar'
+              AND event_date >= date('now', 'localtime')
+            ORDER BY event_date ASC, created_at DESC
+            LIMIT ?
+        """, (limit,))
 
         results = [dict(row) for row in cursor.fetchall()]
         conn.close()
@@ -715,15 +839,24 @@ class Database:
             conn = self.get_connection()
             cursor = conn.cursor()
 
+            # The article row is inserted first, so its time bucket can be looked up once here
+            cursor.execute(
+                f"SELECT {_HOUR_BUCKET_SQL.format(created_at='created_at')} FROM tweets WHERE tweet_id = ?",
+                (tweet_id,)
+            )
+            row = cursor.fetchone()
+            time_bucket = row[0] if row else None
+
             for entity in entities:
                 cursor.execute("""
-                    INSERT INTO entities (tweet_id, entity_text, entity_label, entity_count)
-                    VALUES (?, ?, ?, ?)
+                    INSERT INTO entities (tweet_id, entity_text, entity_label, entity_count, time_bucket)
+                    VALUES (?, ?, ?, ?, ?)
                 """, (
                     tweet_id,
                     entity['text'],
                     entity['label'],
-                    entity.get('count', 1)
+                    entity.get('count', 1),
+                    time_bucket
                 ))
 
             conn.commit()
@@ -747,6 +880,7 @@ class Database:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        bucket = _window_bucket(hours)
 
         if entity_type:
             cursor.execute("""
@@ -760,11 +894,12 @@ class Database:
                 FROM entities e
                 INNER JOIN tweets t ON e.tweet_id = t.tweet_id
                 WHERE e.entity_label = ?
+                AND e.time_bucket >= ?
                 AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
                 GROUP BY e.entity_text, e.entity_label
                 ORDER BY total_mentions DESC
                 LIMIT ?
-            """, (entity_type, hours, limit))
+            """, (entity_type, bucket, hours, limit))
         else:
             cursor.execute("""
                 SELECT
@@ -776,11 +911,12 @@ class Database:
                     MAX(t.created_at) as last_seen
                 FROM entities e
                 INNER JOIN tweets t ON e.tweet_id = t.tweet_id
-                WHERE datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
+                WHERE e.time_bucket >= ?
+                AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
                 GROUP BY e.entity_text, e.entity_label
                 ORDER BY total_mentions DESC
                 LIMIT ?
-            """, (hours, limit))
+            """, (bucket, hours, limit))
 
         results = [dict(row) for row in cursor.fetchall()]
         conn.close()
@@ -795,6 +931,7 @@ class Database:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        bucket = _window_bucket(hours)
 
         cursor.execute("""
             SELECT
@@ -811,9 +948,10 @@ class Database:
             INNER JOIN tweets t ON e.tweet_id = t.tweet_id
             LEFT JOIN sentiment_analysis s ON t.tweet_id = s.tweet_id
             WHERE LOWER(e.entity_text) = LOWER(?)
+            AND e.time_bucket >= ?
             AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
             ORDER BY t.created_at DESC
-        """, (entity_text, hours))
+        """, (entity_text, bucket, hours))
 
         results = [dict(row) for row in cursor.fetchall()]
         conn.close()
@@ -832,6 +970,7 @@ class Database:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        bucket = _window_bucket(hours)
 
         cursor.execute("""
             SELECT
@@ -842,10 +981,11 @@ class Database:
             FROM entities e
             INNER JOIN tweets t ON e.tweet_id = t.tweet_id
             WHERE t.category = ?
+            AND e.time_bucket >= ?
             AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
             GROUP BY e.entity_text, e.entity_label
             ORDER BY total_mentions DESC
-        """, (category, hours))
+        """, (category, bucket, hours))
 
         all_entities = [dict(row) for row in cursor.fetchall()]
         conn.close()
@@ -910,6 +1050,7 @@ class Database:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        bucket = _window_bucket(hours)
 
         # Get top entities as nodes
         if entity_type:
@@ -922,11 +1063,12 @@ class Database:
                 FROM entities e
                 INNER JOIN tweets t ON e.tweet_id = t.tweet_id
                 WHERE e.entity_label = ?
+                AND e.time_bucket >= ?
                 AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
                 GROUP BY e.entity_text, e.entity_label
                 ORDER BY total_mentions DESC
                 LIMIT ?
-            """, (entity_type, hours, entity_limit))
+            """, (entity_type, bucket, hours, entity_limit))
         else:
             cursor.execute("""
                 SELECT
@@ -936,11 +1078,12 @@ class Database:
                     SUM(e.entity_count) as total_mentions
                 FROM entities e
                 INNER JOIN tweets t ON e.tweet_id = t.tweet_id
-                WHERE datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
+                WHERE e.time_bucket >= ?
+                AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
                 GROUP BY e.entity_text, e.entity_label
                 ORDER BY total_mentions DESC
                 LIMIT ?
-            """, (hours, entity_limit))
+            """, (bucket, hours, entity_limit))
 
         # Build entity nodes
         entity_nodes = []
@@ -960,23 +1103,37 @@ class Database:
         keyword_counts = {}  # Track total keyword counts across all entities
         links = []
 
-        for entity_text in entity_texts:
-            # Get top keywords from articles mentioning this entity
-            cursor.execute("""
-                SELECT
-                    wf.word,
-                    COUNT(*) as count
-                FROM word_frequency wf
-                INNER JOIN entities e ON wf.tweet_id = e.tweet_id
-                INNER JOIN tweets t ON wf.tweet_id = t.tweet_id
-                WHERE LOWER(e.entity_text) = LOWER(?)
-                AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
-                GROUP BY wf.word
-                ORDER BY count DESC
-                LIMIT ?
-            """, (entity_text, hours, keywords_per_entity))
-
+        # Top keywords for every entity in one windowed query instead of one query per entity
+        wanted = list(dict.fromkeys(entity_texts))
+        top_keywords = {text: [] for text in wanted}
+        if wanted:
+            cursor.execute(f"""
+                WITH wanted(entity_text) AS (VALUES {','.join(['(?)'] * len(wanted))})
+                SELECT entity_text, word, count
+                FROM (
+                    SELECT
+                        w.entity_text,
+                        wf.word,
+                        COUNT(*) as count,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY w.entity_text ORDER BY COUNT(*) DESC
+                        ) as rank
+                    FROM wanted w
+                    INNER JOIN entities e ON LOWER(e.entity_text) = LOWER(w.entity_text)
+                    INNER JOIN word_frequency wf ON wf.tweet_id = e.tweet_id
+                    INNER JOIN tweets t ON wf.tweet_id = t.tweet_id
+                    WHERE e.time_bucket >= ?
+                    AND datetime(t.created_at) > datetime('now', 'localtime', '-' || ? || ' hours')
+                    GROUP BY w.entity_text, wf.word
+                )
+                WHERE rank <= ?
+                ORDER BY entity_text, rank
+            """, (*wanted, bucket, hours, keywords_per_entity))
             for row in cursor.fetchall():
+                top_keywords[row['entity_text']].append(row)
+
+        for entity_text in entity_texts:
+            for row in top_keywords[entity_text]:
                 keyword_data = dict(row)
                 keyword = keyword_data['word']
                 count = keyword_data['count']
@@ -14,7 +14,7 @@ from datetime import datetime, timedelta
 
 # Import our modules
 from database import Database
-from twitter_stream import TwitterMonitor, TwitterConfig
+from twitter_stream import TwitterMonitor, TwitterConfig, TweetRecord
 from text_processor import TextProcessor
 from sentiment_analyzer_cpu import SentimentAnalyzerCPU  # CPU-based sentiment analysis
 from entity_extractor import EntityExtractor  # Entity recognition
@@ -256,9 +256,12 @@ class OneWordNews:
         except Exception as e:
             logger.error(f"Error processing article: {e}", exc_info=True)
 
-    def process_tweet(self, tweet_data: dict):
-        """Process a single tweet"""
+    def process_tweet(self, tweet_data, sentiment: dict = None):
+        """Process a single tweet (a TweetRecord from the monitor, or a dict), reusing sentiment if already scored"""
         try:
+            if isinstance(tweet_data, TweetRecord):
+                tweet_data = tweet_data.to_dict()
+
             text = tweet_data.get('text', '')
             if not text:
                 return
@@ -274,7 +277,8 @@ class OneWordNews:
             tweet_data['category'] = category
 
             # Analyze sentiment
-            sentiment = self.sentiment_analyzer.analyze_sentiment(text)
+            if sentiment is None:
+                sentiment = self.sentiment_analyzer.analyze_sentiment(text)
 
             # Calculate market impact
             market_impact = self.sentiment_analyzer.get_market_impact_score(sentiment, text)
@@ -298,7 +302,8 @@ class OneWordNews:
                         tweet_id=tweet_data['tweet_id']
                     )
 
-            # Publish to Redis hub
+            # Publish to Redis hub (the raw API payload stays in the database)
+            tweet_data.pop('raw_data', None)
             tweet_with_sentiment = {
                 **tweet_data,
                 'sentiment': sentiment,
@@ -320,9 +325,17 @@ class OneWordNews:
 
         while self.running:
             try:
-                # Get tweet from queue with timeout
-                tweet_data = self.twitter_monitor.get_queue().get(timeout=1)
-                self.process_tweet(tweet_data)
+                # Get a batch of tweets from queue with timeout
+                batch = self.twitter_monitor.get_queue().get(timeout=1)
+                tweets = [t.to_dict() if isinstance(t, TweetRecord) else t for t in batch]
+                tweets = [t for t in tweets if t.get('text')]
+                if not tweets:
+                    continue
+
+                # One batched model pass for the whole burst
+                sentiments = self.sentiment_analyzer.analyze_sentiment_batch([t['text'] for t in tweets])
+                for tweet_data, sentiment in zip(tweets, sentiments):
+                    self.process_tweet(tweet_data, sentiment)
 
             except Empty:
                 # No tweets in queue, continue
@@ -430,6 +443,13 @@ class OneWordNews:
             self.cleanup_thread.start()
             logger.info("Database cleanup monitoring started (runs daily)")
 
+            # Pick up admin jobs queued by standalone web hubs
+            self.control_thread = threading.Thread(
+                target=self.monitor_control_jobs,
+                daemon=True
+            )
+            self.control_thread.start()
+
             # Start Binance monitoring if available
             if self.binance_monitor:
                 self.binance_monitor.start()
@@ -564,7 +584,8 @@ class OneWordNews:
                             category='forex',
                             severity=severity,
                             message=message,
-                            data=event
+                            data=event,
+                            event_date=event_date.isoformat()
                         )
 
                         logger.warning(f"Forex calendar alert created: {impact} USD - {event_name} on {date_str}")
@@ -630,6 +651,22 @@ class OneWordNews:
 
         logger.info("Database cleanup monitoring stopped")
 
+    def monitor_control_jobs(self):
+        """Run admin jobs published on the control channel (web hubs run without an RSS monitor)"""
+        pubsub = self.mq.subscribe(MessageQueue.CHANNEL_CONTROL)
+        if pubsub is None:
+            return
+
+        while self.running:
+            try:
+                for job in self.mq.listen(pubsub):
+                    if job.get('type') == 'refresh_rss':
+                        logger.info("Control job: RSS refresh")
+                        self.rss_monitor.fetch_all_feeds()
+            except Exception as e:
+                logger.error(f"Error in control job monitoring: {e}", exc_info=True)
+                time.sleep(1)
+
     def stop(self):
         """Stop the bot"""
         logger.info("Stopping bot...")
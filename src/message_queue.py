@@ -3,12 +3,69 @@ Redis Message Queue for Hub Architecture
 Centralizes all pub/sub communication between workers and web clients
 """
 import redis
-import json
+import orjson
 import logging
 import os
+import socket
+import threading
 from typing import Dict, Any, Optional
 
 
+# Messages are encoded once at publish time; numpy scalars and non-str keys are accepted
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Upper bound on Redis sockets per process and per URL
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONN', '10'))
+
+# Kernel receive buffer for subscriber sockets, so worker bursts queue in the kernel instead of
+# stalling the TCP window while the hub is busy broadcasting (capped by net.core.rmem_max)
+SUBSCRIBER_RCVBUF = int(os.getenv('REDIS_SUB_RCVBUF', str(4 * 1024 * 1024)))
+
+_pools: Dict[str, redis.ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(redis_url: str) -> redis.ConnectionPool:
+    """Process-wide bounded pool for redis_url; callers wait for a free connection when it is exhausted"""
+    with _pools_lock:
+        pool = _pools.get(redis_url)
+        if pool is None:
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=5,
+                decode_responses=True,  # Auto-decode to strings
+                socket_connect_timeout=5,
+                socket_keepalive=True,
+                health_check_interval=30
+            )
+            _pools[redis_url] = pool
+        return pool
+
+
+def _set_receive_buffer(connection):
+    """Best-effort SO_RCVBUF on a connected redis-py connection"""
+    sock = getattr(connection, '_sock', None)
+    if sock is None or SUBSCRIBER_RCVBUF <= 0:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SUBSCRIBER_RCVBUF)
+    except OSError:
+        pass
+
+
+class _BufferedPubSub(redis.client.PubSub):
+    """PubSub that re-applies the receive buffer whenever its connection reconnects"""
+
+    def on_connect(self, connection):
+        _set_receive_buffer(connection)
+        super().on_connect(connection)
+
+
+# PubSub message types that carry a payload (plain and pattern subscriptions)
+_DATA_MESSAGES = frozenset({'message', 'pmessage'})
+
+
 class MessageQueue:
     """Redis-based message queue for publishing updates to the hub"""
 
@@ -18,13 +75,19 @@ class MessageQueue:
     CHANNEL_STATS = 'channel:stats'
     CHANNEL_CRYPTO = 'channel:crypto'
     CHANNEL_FOREX = 'channel:forex'
+    # Matches every worker channel, including ones added later
+    CHANNEL_PATTERN = 'channel:*'
+    # Admin jobs for the worker process; outside CHANNEL_PATTERN so hubs never forward them to browsers
+    CHANNEL_CONTROL = 'control:jobs'
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None,
+                 connection_pool: Optional[redis.ConnectionPool] = None):
         """
         Initialize Redis connection
 
         Args:
             redis_url: Redis connection URL (defaults to REDIS_URL env var or localhost)
+            connection_pool: Pool to draw connections from (defaults to the shared pool for redis_url)
         """
         self.logger = logging.getLogger(__name__)
 
@@ -32,12 +95,8 @@ class MessageQueue:
         self.redis_url = redis_url or os.getenv('REDIS_URL', 'redis://localhost:6379')
 
         try:
-            self.redis_client = redis.from_url(
-                self.redis_url,
-                decode_responses=True,  # Auto-decode to strings
-                socket_connect_timeout=5,
-                socket_keepalive=True,
-                health_check_interval=30
+            self.redis_client = redis.Redis(
+                connection_pool=connection_pool or get_connection_pool(self.redis_url)
             )
 
             # Test connection
@@ -47,6 +106,16 @@ class MessageQueue:
         except Exception as e:
             self.logger.error(f"❌ Failed to connect to Redis: {e}")
             self.redis_client = None
+            return
+
+        # Dragonfly speaks the Redis protocol (pub/sub included) and fans out across all cores.
+        # Informational only: an ACL that denies INFO must not cost us a working connection
+        try:
+            server_info = self.redis_client.info('server')
+            if 'dragonfly_version' in server_info:
+                self.logger.info(f"Message broker is Dragonfly {server_info['dragonfly_version']}")
+        except Exception as e:
+            self.logger.debug(f"Could not read broker server info: {e}")
 
     def is_connected(self) -> bool:
         """Check if Redis is connected"""
@@ -64,7 +133,7 @@ class MessageQueue:
 
         Args:
             channel: Channel name
-            message: Dictionary to publish (will be JSON-encoded)
+            message: Dictionary to publish (JSON-encoded once here with orjson)
 
         Returns:
             True if successful, False otherwise
@@ -74,7 +143,7 @@ class MessageQueue:
             return False
 
         try:
-            json_message = json.dumps(message)
+            json_message = orjson.dumps(message, option=_ORJSON_OPTS)
             self.redis_client.publish(channel, json_message)
             self.logger.debug(f"📤 Published to {channel}: {len(json_message)} bytes")
             return True
@@ -118,6 +187,13 @@ class MessageQueue:
             'data': forex_data
         })
 
+    def publish_control(self, job: str, **params) -> bool:
+        """Queue an admin job (e.g. 'refresh_rss') for the worker process"""
+        return self.publish(self.CHANNEL_CONTROL, {
+            'type': job,
+            'data': params
+        })
+
     def subscribe(self, *channels):
         """
         Subscribe to one or more channels
@@ -128,18 +204,35 @@ class MessageQueue:
         Returns:
             PubSub object for listening
         """
+        return self._open_pubsub('subscribe', channels)
+
+    def psubscribe(self, *patterns):
+        """
+        Subscribe to every channel matching one or more glob patterns (e.g. CHANNEL_PATTERN)
+
+        Args:
+            *patterns: Channel patterns to subscribe to
+
+        Returns:
+            PubSub object for listening
+        """
+        return self._open_pubsub('psubscribe', patterns)
+
+    def _open_pubsub(self, command: str, names):
+        """New PubSub with command ('subscribe' or 'psubscribe') applied to names"""
         if not self.is_connected():
-            self.logger.error("Cannot subscribe: Redis not connected")
+            self.logger.error(f"Cannot {command}: Redis not connected")
             return None
 
         try:
-            pubsub = self.redis_client.pubsub()
-            pubsub.subscribe(*channels)
-            self.logger.info(f"📥 Subscribed to channels: {', '.join(channels)}")
+            pubsub = _BufferedPubSub(self.redis_client.connection_pool)
+            getattr(pubsub, command)(*names)
+            _set_receive_buffer(pubsub.connection)
+            self.logger.info(f"📥 Subscribed to channels: {', '.join(names)}")
             return pubsub
 
         except Exception as e:
-            self.logger.error(f"Failed to subscribe: {e}")
+            self.logger.error(f"Failed to {command}: {e}")
             return None
 
     def get_message(self, pubsub, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
@@ -156,8 +249,8 @@ class MessageQueue:
         try:
             message = pubsub.get_message(timeout=timeout)
 
-            if message and message['type'] == 'message':
-                data = json.loads(message['data'])
+            if message and message['type'] in _DATA_MESSAGES:
+                data = orjson.loads(message['data'])
                 return data
 
             return None
@@ -166,6 +259,24 @@ class MessageQueue:
             self.logger.error(f"Failed to get message: {e}")
             return None
 
+    def listen(self, pubsub):
+        """
+        Block on a subscription and yield messages as they arrive
+
+        Args:
+            pubsub: PubSub object from subscribe()
+
+        Yields:
+            Decoded message dictionaries (subscribe confirmations and undecodable payloads are skipped)
+        """
+        for message in pubsub.listen():
+            if message['type'] not in _DATA_MESSAGES:
+                continue
+            try:
+                yield orjson.loads(message['data'])
+            except ValueError as e:
+                self.logger.error(f"Failed to decode message: {e}")
+
     def close(self):
         """Close Redis connection"""
         if self.redis_client:
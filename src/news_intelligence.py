@@ -166,7 +166,8 @@ class NewsIntelligence:
                             keyword=trend['keyword'],
                             momentum=trend['momentum'],
                             article_count=trend['current_count'],
-                            sentiment=trend['avg_sentiment']
+                            sentiment=trend['avg_sentiment'],
+                            fire_and_forget=True
                         )
 
             self.logger.info(f"Detected {len(trending)} trending topics")
@@ -265,7 +266,8 @@ class NewsIntelligence:
                     brief_type='morning',
                     summary=brief['summary'],
                     stats=brief['stats'],
-                    top_stories=brief['top_stories']
+                    top_stories=brief['top_stories'],
+                    fire_and_forget=True
                 )
 
             self.last_briefings['morning'] = datetime.now()
@@ -284,7 +286,8 @@ class NewsIntelligence:
                     brief_type='midday',
                     summary=brief['summary'],
                     stats=brief['stats'],
-                    top_stories=brief['top_stories']
+                    top_stories=brief['top_stories'],
+                    fire_and_forget=True
                 )
 
             self.last_briefings['midday'] = datetime.now()
@@ -303,7 +306,8 @@ class NewsIntelligence:
                     brief_type='evening',
                     summary=brief['summary'],
                     stats=brief['stats'],
-                    top_stories=brief['top_stories']
+                    top_stories=brief['top_stories'],
+                    fire_and_forget=True
                 )
 
             self.last_briefings['evening'] = datetime.now()
@@ -1,5 +1,9 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
@@ -8,10 +12,57 @@ import logging
 class SlackNotifier:
     """Service for sending notifications to Slack via webhook"""
 
+    # Static Block Kit pieces, built once and shared by every message (never mutated)
+    _DIVIDER_BLOCK = {"type": "divider"}
+    _TOP_STORIES_BLOCK = {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": "*🔥 Top Stories:*"}
+    }
+    _WHAT_CHANGED_HEADER = {
+        "type": "header",
+        "text": {"type": "plain_text", "text": "📊 What's Changed Since Your Last Visit", "emoji": True}
+    }
+
+    # Field templates, only the values are interpolated per message
+    _BRIEF_FIELD_TEMPLATES = (
+        "*📊 Total Articles:*\n{total_articles}",
+        "*📈 Avg Sentiment:*\n{avg_sentiment:.2f}",
+        "*🔥 Trending Topics:*\n{trending_count}",
+        "*📰 Top Category:*\n{top_category}"
+    )
+    _TREND_FIELD_TEMPLATES = (
+        "*Trend Status:*\n{trend}",
+        "*Momentum Score:*\n{momentum:.2f}x",
+        "*Article Count:*\n{article_count}",
+        "*Sentiment:*\n{sentiment_emoji} {sentiment_text} ({sentiment:.2f})"
+    )
+    _WHAT_CHANGED_FIELD_TEMPLATES = (
+        "*🆕 New Articles:*\n{new_articles}",
+        "*🔥 New Trending Topics:*\n{new_trends}",
+        "*📈 Sentiment Shifts:*\n{sentiment_changes}",
+        "*⏱️ Time Since Last Visit:*\n{time_away}"
+    )
+    _STORY_TEMPLATE = "{emoji} *{index}. {keyword}*\n_{summary}_"
+
     def __init__(self, webhook_url: str):
         self.webhook_url = webhook_url
         self.logger = logging.getLogger(__name__)
 
+        # Persistent session keeps the TLS connection to hooks.slack.com alive between alerts
+        # (retries only cover connection failures, so a message is never posted twice)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update({'Content-Type': 'application/json'})
+
+        # Single background sender so fire-and-forget notifications keep their order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack")
+        atexit.register(self._executor.shutdown, wait=True)
+
     def send_message(self, text: str, blocks: List[Dict] = None,
                      attachments: List[Dict] = None) -> bool:
         """Send a message to Slack
@@ -33,10 +84,10 @@ class SlackNotifier:
             if attachments:
                 payload["attachments"] = attachments
 
-            response = requests.post(
+            # Content-Type is set on the session, the body is pre-encoded by orjson
+            response = self._session.post(
                 self.webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
+                data=orjson.dumps(payload),
                 timeout=10
             )
 
@@ -51,8 +102,45 @@ class SlackNotifier:
             self.logger.error(f"Error sending Slack notification: {e}")
             return False
 
+    @staticmethod
+    def _header(text: str) -> Dict:
+        """Build a plain-text header block"""
+        return {"type": "header", "text": {"type": "plain_text", "text": text, "emoji": True}}
+
+    @staticmethod
+    def _section(text: str) -> Dict:
+        """Build a mrkdwn section block"""
+        return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+    @staticmethod
+    def _fields(templates, values: Dict) -> Dict:
+        """Build a section block of mrkdwn fields from templates"""
+        return {
+            "type": "section",
+            "fields": [{"type": "mrkdwn", "text": t.format(**values)} for t in templates]
+        }
+
+    def send_message_async(self, text: str, blocks: List[Dict] = None,
+                           attachments: List[Dict] = None) -> Future:
+        """Queue a message for the background sender and return immediately
+
+        Failures are logged by send_message on the sender thread.
+
+        Returns:
+            Future resolving to the send_message result
+        """
+        return self._executor.submit(self.send_message, text, blocks, attachments)
+
+    def _dispatch(self, fire_and_forget: bool, text: str, blocks: List[Dict] = None,
+                  attachments: List[Dict] = None) -> bool:
+        """Send now, or queue the send when fire_and_forget is set"""
+        if fire_and_forget:
+            self.send_message_async(text, blocks, attachments)
+            return True
+        return self.send_message(text, blocks, attachments)
+
     def send_alert(self, title: str, message: str, severity: str = "info",
-                   fields: Dict[str, str] = None) -> bool:
+                   fields: Dict[str, str] = None, fire_and_forget: bool = False) -> bool:
         """Send a formatted alert to Slack
 
         Args:
@@ -60,9 +148,10 @@ class SlackNotifier:
             message: Alert message
             severity: One of: critical, high, medium, low, info
             fields: Additional key-value pairs to display
+            fire_and_forget: Queue the send on the background thread instead of blocking
 
         Returns:
-            True if successful
+            True if successful (or queued)
         """
         # Color coding by severity
         color_map = {
@@ -91,13 +180,15 @@ class SlackNotifier:
                 for k, v in fields.items()
             ]
 
-        return self.send_message(
+        return self._dispatch(
+            fire_and_forget,
             text=f"{title}: {message}",
             attachments=[attachment]
         )
 
     def send_daily_brief(self, brief_type: str, summary: str,
-                        stats: Dict[str, any], top_stories: List[Dict]) -> bool:
+                        stats: Dict[str, any], top_stories: List[Dict],
+                        fire_and_forget: bool = False) -> bool:
         """Send a daily briefing to Slack
 
         Args:
@@ -105,80 +196,46 @@ class SlackNotifier:
             summary: AI-generated summary text
             stats: Statistics dictionary
             top_stories: List of top story dictionaries
+            fire_and_forget: Queue the send on the background thread instead of blocking
 
         Returns:
-            True if successful
+            True if successful (or queued)
         """
         # Create blocks for rich formatting
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"📰 {brief_type.title()} News Brief",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": summary
-                }
-            },
-            {
-                "type": "divider"
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*📊 Total Articles:*\n{stats.get('total_articles', 0)}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*📈 Avg Sentiment:*\n{stats.get('avg_sentiment', 0):.2f}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*🔥 Trending Topics:*\n{stats.get('trending_count', 0)}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*📰 Top Category:*\n{stats.get('top_category', 'N/A')}"
-                    }
-                ]
-            }
+            self._header(f"📰 {brief_type.title()} News Brief"),
+            self._section(summary),
+            self._DIVIDER_BLOCK,
+            self._fields(self._BRIEF_FIELD_TEMPLATES, {
+                'total_articles': stats.get('total_articles', 0),
+                'avg_sentiment': stats.get('avg_sentiment', 0),
+                'trending_count': stats.get('trending_count', 0),
+                'top_category': stats.get('top_category', 'N/A')
+            })
         ]
 
         # Add top stories
         if top_stories:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🔥 Top Stories:*"
-                }
-            })
+            blocks.append(self._TOP_STORIES_BLOCK)
 
             for i, story in enumerate(top_stories[:5], 1):
-                sentiment_emoji = "🟢" if story.get('sentiment', 0) > 0.1 else "🔴" if story.get('sentiment', 0) < -0.1 else "⚪"
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"{sentiment_emoji} *{i}. {story.get('keyword', 'Unknown')}*\n_{story.get('summary', 'No summary available')}_"
-                    }
-                })
-
-        return self.send_message(
+                sentiment = story.get('sentiment', 0)
+                blocks.append(self._section(self._STORY_TEMPLATE.format(
+                    emoji="🟢" if sentiment > 0.1 else "🔴" if sentiment < -0.1 else "⚪",
+                    index=i,
+                    keyword=story.get('keyword', 'Unknown'),
+                    summary=story.get('summary', 'No summary available')
+                )))
+
+        return self._dispatch(
+            fire_and_forget,
             text=f"{brief_type.title()} News Brief",
             blocks=blocks
         )
 
     def send_trend_alert(self, keyword: str, momentum: float,
-                        article_count: int, sentiment: float) -> bool:
+                        article_count: int, sentiment: float,
+                        fire_and_forget: bool = False) -> bool:
         """Send a trending topic alert
 
         Args:
@@ -186,9 +243,10 @@ class SlackNotifier:
             momentum: Momentum score (velocity)
             article_count: Number of articles
             sentiment: Average sentiment
+            fire_and_forget: Queue the send on the background thread instead of blocking
 
         Returns:
-            True if successful
+            True if successful (or queued)
         """
         # Determine emoji based on momentum
         if momentum > 2.0:
@@ -208,95 +266,50 @@ class SlackNotifier:
         sentiment_emoji = "🟢" if sentiment > 0.1 else "🔴" if sentiment < -0.1 else "⚪"
 
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} Trending: {keyword}",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Trend Status:*\n{trend}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Momentum Score:*\n{momentum:.2f}x"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Article Count:*\n{article_count}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Sentiment:*\n{sentiment_emoji} {sentiment_text} ({sentiment:.2f})"
-                    }
-                ]
-            }
+            self._header(f"{emoji} Trending: {keyword}"),
+            self._fields(self._TREND_FIELD_TEMPLATES, {
+                'trend': trend,
+                'momentum': momentum,
+                'article_count': article_count,
+                'sentiment_emoji': sentiment_emoji,
+                'sentiment_text': sentiment_text,
+                'sentiment': sentiment
+            })
         ]
 
-        return self.send_message(
+        return self._dispatch(
+            fire_and_forget,
             text=f"Trending: {keyword} ({trend})",
             blocks=blocks
         )
 
-    def send_what_changed(self, changes: Dict[str, any]) -> bool:
+    def send_what_changed(self, changes: Dict[str, any], fire_and_forget: bool = False) -> bool:
         """Send a 'What Changed' summary
 
         Args:
             changes: Dictionary with change statistics
+            fire_and_forget: Queue the send on the background thread instead of blocking
 
         Returns:
-            True if successful
+            True if successful (or queued)
         """
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "📊 What's Changed Since Your Last Visit",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*🆕 New Articles:*\n{changes.get('new_articles', 0)}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*🔥 New Trending Topics:*\n{changes.get('new_trends', 0)}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*📈 Sentiment Shifts:*\n{changes.get('sentiment_changes', 0)}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*⏱️ Time Since Last Visit:*\n{changes.get('time_away', 'N/A')}"
-                    }
-                ]
-            }
+            self._WHAT_CHANGED_HEADER,
+            self._fields(self._WHAT_CHANGED_FIELD_TEMPLATES, {
+                'new_articles': changes.get('new_articles', 0),
+                'new_trends': changes.get('new_trends', 0),
+                'sentiment_changes': changes.get('sentiment_changes', 0),
+                'time_away': changes.get('time_away', 'N/A')
+            })
         ]
 
         # Add new trending topics
         if changes.get('new_trending_topics'):
             topics_text = "\n".join([f"• {t}" for t in changes['new_trending_topics'][:5]])
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*New Trending Topics:*\n{topics_text}"
-                }
-            })
+            blocks.append(self._section(f"*New Trending Topics:*\n{topics_text}"))
 
-        return self.send_message(
+        return self._dispatch(
+            fire_and_forget,
             text="What's Changed Summary",
             blocks=blocks
         )
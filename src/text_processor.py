@@ -1,101 +1,168 @@
 import re
+from collections import Counter
 from typing import List, Set
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+# NLTK's English stop word list, vendored to avoid the nltk import and corpus download
+_ENGLISH_STOP_WORDS = frozenset({
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're",
+    "you've", "you'll", "you'd", 'your', 'yours', 'yourself', 'yourselves', 'he',
+    'him', 'his', 'himself', 'she', "she's", 'her', 'hers', 'herself', 'it', "it's",
+    'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which',
+    'who', 'whom', 'this', 'that', "that'll", 'these', 'those', 'am', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do',
+    'does', 'did', 'doing', 'a', 'an', 'the', 'and', 'but', 'if', 'or', 'because',
+    'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about', 'against',
+    'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again',
+    'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all',
+    'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no',
+    'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't',
+    'can', 'will', 'just', 'don', "don't", 'should', "should've", 'now', 'd', 'll',
+    'm', 'o', 're', 've', 'y', 'ain', 'aren', "aren't", 'couldn', "couldn't",
+    'didn', "didn't", 'doesn', "doesn't", 'hadn', "hadn't", 'hasn', "hasn't",
+    'haven', "haven't", 'isn', "isn't", 'ma', 'mightn', "mightn't", 'mustn',
+    "mustn't", 'needn', "needn't", 'shan', "shan't", 'shouldn', "shouldn't", 'wasn',
+    "wasn't", 'weren', "weren't", 'won', "won't", 'wouldn', "wouldn't"
+})
+
+# Stop words shared by all TextProcessor instances: NLTK's list plus common words
+# that carry no signal in headlines and tweets
+_STOP_WORDS = _ENGLISH_STOP_WORDS | frozenset({
+    # Twitter specific
+    'rt', 'via', 'http', 'https', 'amp', 'dm', 'cc', 'mt', 'htt',
+
+    # Common verbs
+    'get', 'go', 'see', 'know', 'want', 'make', 'got', 'take',
+    'come', 'came', 'went', 'going', 'getting', 'making', 'taking',
+    'coming', 'seen', 'came', 'give', 'gave', 'giving', 'put',
+    'tell', 'told', 'telling', 'let', 'use', 'used', 'using',
+
+    # Common adjectives/adverbs
+    'like', 'just', 'new', 'back', 'still', 'even', 'also',
+    'really', 'very', 'too', 'well', 'good', 'great', 'best',
+    'better', 'right', 'left', 'high', 'low', 'big', 'little',
+    'old', 'young', 'long', 'short', 'early', 'late',
+
+    # Common nouns
+    'time', 'year', 'day', 'week', 'month', 'today', 'tonight',
+    'yesterday', 'tomorrow', 'people', 'thing', 'things', 'way',
+    'man', 'woman', 'person', 'lot', 'lots', 'bit', 'something',
+
+    # Pronouns and determiners
+    'one', 'two', 'three', 'four', 'five', 'someone', 'anyone',
+    'everyone', 'nobody', 'somebody', 'everybody', 'anything',
+    'everything', 'nothing', 'us', 'them', 'these', 'those',
+
+    # Common words
+    'said', 'say', 'says', 'saying', 'will', 'can', 'could',
+    'would', 'should', 'must', 'may', 'might', 'much', 'many',
+    'made', 'first', 'last', 'need', 'look', 'looking', 'looks',
+    'looked', 'think', 'thought', 'thinking', 'feel', 'felt',
+    'feeling', 'believe', 'believe', 'yes', 'yeah', 'yep', 'nope',
+    'ok', 'okay', 'sure', 'maybe', 'perhaps', 'probably',
+
+    # Questions words (usually not meaningful)
+    'who', 'what', 'when', 'where', 'why', 'how', 'which',
+
+    # Articles and conjunctions (redundant but explicit)
+    'the', 'a', 'an', 'and', 'or', 'but', 'if', 'then', 'than',
+    'as', 'at', 'by', 'for', 'from', 'in', 'into', 'of', 'on',
+    'to', 'with', 'without', 'about', 'after', 'before', 'during',
+
+    # Numbers as words
+    'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven',
+    'eight', 'nine', 'ten', 'hundred', 'thousand', 'million', 'billion',
+
+    # Misc common
+    'ever', 'never', 'always', 'often', 'sometimes', 'usually',
+    'here', 'there', 'everywhere', 'anywhere', 'somewhere', 'nowhere',
+    'next', 'previous', 'another', 'other', 'others', 'same', 'different'
+})
+
+# URLs, mentions and special characters, stripped in a single pass by clean_text
+# ('#' is kept here and dropped separately so hashtags keep their word attached)
+_CLEAN_RE = re.compile(r'http\S+|www\S+|@\w+|[^a-zA-Z0-9\s#]+')
+
+# Word tokens for dictionary lookups ('&' kept so terms like 's&p' stay whole)
+_WORD_RE = re.compile(r'[\w&]+')
+
+# Financial and market-related terms matched by extract_financial_terms
+_FINANCIAL_TERMS = frozenset({
+    # Markets
+    'stock', 'stocks', 'market', 'markets', 'trading', 'trader',
+    'nasdaq', 'dow', 'sp500', 's&p', 'bull', 'bear', 'rally',
+    'crash', 'correction', 'volatility', 'index', 'indices',
+
+    # Crypto
+    'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency',
+    'blockchain', 'defi', 'nft', 'altcoin', 'token',
+
+    # Commodities
+    'gold', 'silver', 'oil', 'crude', 'commodity', 'commodities',
+    'wti', 'brent', 'barrel',
+
+    # Economic indicators
+    'inflation', 'deflation', 'gdp', 'unemployment', 'jobs',
+    'employment', 'cpi', 'ppi', 'recession', 'expansion',
+    'interest', 'rates', 'yield', 'bonds', 'treasury',
+
+    # Fed/Policy
+    'fed', 'federal', 'reserve', 'fomc', 'powell', 'monetary',
+    'policy', 'rate', 'hike', 'cut', 'taper', 'qe', 'quantitative',
+
+    # General finance
+    'price', 'prices', 'dollar', 'euro', 'currency', 'forex',
+    'investment', 'investing', 'investor', 'portfolio', 'fund',
+    'capital', 'profit', 'loss', 'revenue', 'earnings'
+})
+
+
+# Category keywords in priority order - the first category with a keyword in the text wins
+_CATEGORY_KEYWORDS = [
+    ('trump', ['trump', 'donald', 'potus', 'maga', 'president trump']),
+    ('fomc', ['fomc', 'federal reserve', 'fed', 'powell', 'interest rate', 'monetary policy']),
+    ('markets', ['stock', 'market', 'trading', 'nasdaq', 'dow', 'sp500']),
+    ('crypto', ['bitcoin', 'crypto', 'ethereum', 'blockchain', 'btc', 'eth']),
+    ('commodities', ['gold', 'silver', 'oil', 'crude', 'commodity']),
+    ('usa_news', ['usa', 'america', 'american', 'congress', 'senate', 'washington']),
+]
+
+_KEYWORD_PRIORITY = {}
+for _priority, (_category, _keywords) in enumerate(_CATEGORY_KEYWORDS):
+    for _keyword in _keywords:
+        _KEYWORD_PRIORITY.setdefault(_keyword, _priority)
+
+# Zero-width lookahead so overlapping keywords are all seen (substring match, like 'in');
+# alternatives are in priority order so the best keyword wins at each position
+_CATEGORY_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in _KEYWORD_PRIORITY) + '))'
+)
 
 
 class TextProcessor:
     def __init__(self):
         """Initialize text processor with stop words"""
-        self.stop_words = set(stopwords.words('english'))
-
-        # Add additional common words to filter
-        additional_stops = {
-            # Twitter specific
-            'rt', 'via', 'http', 'https', 'amp', 'dm', 'cc', 'mt', 'htt',
-
-            # Common verbs
-            'get', 'go', 'see', 'know', 'want', 'make', 'got', 'take',
-            'come', 'came', 'went', 'going', 'getting', 'making', 'taking',
-            'coming', 'seen', 'came', 'give', 'gave', 'giving', 'put',
-            'tell', 'told', 'telling', 'let', 'use', 'used', 'using',
-
-            # Common adjectives/adverbs
-            'like', 'just', 'new', 'back', 'still', 'even', 'also',
-            'really', 'very', 'too', 'well', 'good', 'great', 'best',
-            'better', 'right', 'left', 'high', 'low', 'big', 'little',
-            'old', 'young', 'long', 'short', 'early', 'late',
-
-            # Common nouns
-            'time', 'year', 'day', 'week', 'month', 'today', 'tonight',
-            'yesterday', 'tomorrow', 'people', 'thing', 'things', 'way',
-            'man', 'woman', 'person', 'lot', 'lots', 'bit', 'something',
-
-            # Pronouns and determiners
-            'one', 'two', 'three', 'four', 'five', 'someone', 'anyone',
-            'everyone', 'nobody', 'somebody', 'everybody', 'anything',
-            'everything', 'nothing', 'us', 'them', 'these', 'those',
-
-            # Common words
-            'said', 'say', 'says', 'saying', 'will', 'can', 'could',
-            'would', 'should', 'must', 'may', 'might', 'much', 'many',
-            'made', 'first', 'last', 'need', 'look', 'looking', 'looks',
-            'looked', 'think', 'thought', 'thinking', 'feel', 'felt',
-            'feeling', 'believe', 'believe', 'yes', 'yeah', 'yep', 'nope',
-            'ok', 'okay', 'sure', 'maybe', 'perhaps', 'probably',
-
-            # Questions words (usually not meaningful)
-            'who', 'what', 'when', 'where', 'why', 'how', 'which',
-
-            # Articles and conjunctions (redundant but explicit)
-            'the', 'a', 'an', 'and', 'or', 'but', 'if', 'then', 'than',
-            'as', 'at', 'by', 'for', 'from', 'in', 'into', 'of', 'on',
-            'to', 'with', 'without', 'about', 'after', 'before', 'during',
-
-            # Numbers as words
-            'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven',
-            'eight', 'nine', 'ten', 'hundred', 'thousand', 'million', 'billion',
-
-            # Misc common
-            'ever', 'never', 'always', 'often', 'sometimes', 'usually',
-            'here', 'there', 'everywhere', 'anywhere', 'somewhere', 'nowhere',
-            'next', 'previous', 'another', 'other', 'others', 'same', 'different'
-        }
-        self.stop_words.update(additional_stops)
+        self.stop_words = _STOP_WORDS
+
+        # Compiled keyword tokenizers, keyed by minimum keyword length
+        self._token_res = {}
 
     def clean_text(self, text: str) -> str:
         """Clean tweet text"""
         if not text:
             return ""
 
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-
-        # Remove mentions
-        text = re.sub(r'@\w+', '', text)
-
-        # Remove hashtags (keep the word, remove #)
-        text = re.sub(r'#', '', text)
+        # Remove URLs, mentions and special characters, drop '#' from hashtags,
+        # then collapse whitespace
+        return ' '.join(_CLEAN_RE.sub(' ', text).replace('#', '').split())
 
-        # Remove special characters but keep alphanumeric and spaces
-        text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-
-        return text.strip()
+    def _token_re(self, min_length: int):
+        """Get compiled regex matching whole alphabetic tokens of at least min_length chars"""
+        pattern = self._token_res.get(min_length)
+        if pattern is None:
+            pattern = re.compile(r'\b[a-z]{%d,}\b' % min_length)
+            self._token_res[min_length] = pattern
+        return pattern
 
     def extract_keywords(self, text: str, min_length: int = 4) -> List[str]:
         """Extract meaningful keywords from text"""
@@ -104,23 +171,12 @@ class TextProcessor:
         if not cleaned_text:
             return []
 
-        # Tokenize and convert to lowercase
-        try:
-            tokens = word_tokenize(cleaned_text.lower())
-        except:
-            # Fallback to simple split if tokenization fails
-            tokens = cleaned_text.lower().split()
-
-        # Filter stop words and short words - be more aggressive
-        keywords = [
-            word for word in tokens
-            if word.lower() not in self.stop_words  # Ensure lowercase comparison
-            and len(word) >= min_length  # Increased to 4 chars minimum
-            and word.isalpha()  # Only alphabetic characters
-            and not word.isdigit()  # No pure numbers
-        ]
+        # Single regex pass yields lowercase alphabetic tokens of the minimum length,
+        # so only the stop word lookup is left per token
+        tokens = self._token_re(min_length).findall(cleaned_text.lower())
+        stop_words = self.stop_words
 
-        return keywords
+        return [word for word in tokens if word not in stop_words]
 
     def extract_hashtags(self, text: str) -> List[str]:
         """Extract hashtags from text"""
@@ -136,10 +192,7 @@ class TextProcessor:
 
     def get_word_frequency(self, keywords: List[str]) -> dict:
         """Get frequency count of words"""
-        freq = {}
-        for word in keywords:
-            freq[word] = freq.get(word, 0) + 1
-        return freq
+        return dict(Counter(keywords))
 
     def is_relevant_keyword(self, word: str, min_length: int = 3) -> bool:
         """Check if a word is a relevant keyword"""
@@ -153,77 +206,30 @@ class TextProcessor:
 
     def extract_financial_terms(self, text: str) -> List[str]:
         """Extract financial and market-related terms"""
-        financial_keywords = {
-            # Markets
-            'stock', 'stocks', 'market', 'markets', 'trading', 'trader',
-            'nasdaq', 'dow', 'sp500', 's&p', 'bull', 'bear', 'rally',
-            'crash', 'correction', 'volatility', 'index', 'indices',
-
-            # Crypto
-            'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'cryptocurrency',
-            'blockchain', 'defi', 'nft', 'altcoin', 'token',
-
-            # Commodities
-            'gold', 'silver', 'oil', 'crude', 'commodity', 'commodities',
-            'wti', 'brent', 'barrel',
-
-            # Economic indicators
-            'inflation', 'deflation', 'gdp', 'unemployment', 'jobs',
-            'employment', 'cpi', 'ppi', 'recession', 'expansion',
-            'interest', 'rates', 'yield', 'bonds', 'treasury',
-
-            # Fed/Policy
-            'fed', 'federal', 'reserve', 'fomc', 'powell', 'monetary',
-            'policy', 'rate', 'hike', 'cut', 'taper', 'qe', 'quantitative',
-
-            # General finance
-            'price', 'prices', 'dollar', 'euro', 'currency', 'forex',
-            'investment', 'investing', 'investor', 'portfolio', 'fund',
-            'capital', 'profit', 'loss', 'revenue', 'earnings'
-        }
-
-        text_lower = text.lower()
+        # One tokenizing pass plus a set lookup per word, instead of a regex search per term
         found_terms = []
+        seen = set()
 
-        for term in financial_keywords:
-            if re.search(r'\b' + re.escape(term) + r'\b', text_lower):
-                found_terms.append(term)
+        for word in _WORD_RE.findall(text.lower()):
+            if word in _FINANCIAL_TERMS and word not in seen:
+                seen.add(word)
+                found_terms.append(word)
 
         return found_terms
 
     def categorize_text(self, text: str, hashtags: List[str] = None) -> str:
         """Categorize text based on content"""
-        text_lower = text.lower()
-        hashtags_lower = [h.lower() for h in (hashtags or [])]
-
-        # Trump-related
-        trump_keywords = ['trump', 'donald', 'potus', 'maga', 'president trump']
-        if any(keyword in text_lower for keyword in trump_keywords):
-            return 'trump'
-
-        # FOMC/Fed related
-        fed_keywords = ['fomc', 'federal reserve', 'fed', 'powell', 'interest rate', 'monetary policy']
-        if any(keyword in text_lower for keyword in fed_keywords):
-            return 'fomc'
-
-        # Market/Finance related
-        market_keywords = ['stock', 'market', 'trading', 'nasdaq', 'dow', 'sp500']
-        if any(keyword in text_lower for keyword in market_keywords):
-            return 'markets'
-
-        # Crypto related
-        crypto_keywords = ['bitcoin', 'crypto', 'ethereum', 'blockchain', 'btc', 'eth']
-        if any(keyword in text_lower for keyword in crypto_keywords):
-            return 'crypto'
-
-        # Commodities related
-        commodity_keywords = ['gold', 'silver', 'oil', 'crude', 'commodity']
-        if any(keyword in text_lower for keyword in commodity_keywords):
-            return 'commodities'
-
-        # USA news/politics
-        usa_keywords = ['usa', 'america', 'american', 'congress', 'senate', 'washington']
-        if any(keyword in text_lower for keyword in usa_keywords):
-            return 'usa_news'
+        # Single scan over every keyword position; the highest priority category wins
+        best = len(_CATEGORY_KEYWORDS)
+
+        for match in _CATEGORY_RE.finditer(text.lower()):
+            priority = _KEYWORD_PRIORITY[match.group(1)]
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+
+        if best < len(_CATEGORY_KEYWORDS):
+            return _CATEGORY_KEYWORDS[best][0]
 
         return 'general'
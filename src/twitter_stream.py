@@ -1,34 +1,302 @@
 import tweepy
 import os
+import sys
 import time
-import json
+import orjson
+import shelve
+import hashlib
+import atexit
+import random
+import functools
+import weakref
+import re
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
+from dataclasses import dataclass
 import logging
-from queue import Queue
+from queue import Empty
 import threading
+from collections import deque
+
+
+@dataclass(slots=True)
+class TweetRecord:
+    """Fields of a tweet that downstream processing uses, queued instead of a dict"""
+    tweet_id: str
+    text: str
+    created_at: Optional[str] = None
+    user_handle: Optional[str] = None
+    user_name: Optional[str] = None
+    author_id: Optional[str] = None
+    retweet_count: int = 0
+    like_count: int = 0
+    reply_count: int = 0
+    raw_data: Optional[bytes] = None  # orjson-encoded API payload, only kept with include_raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for processing and storage, omitting unset raw_data"""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if data['raw_data'] is None:
+            del data['raw_data']
+        return data
+
+
+def _build_tweet_data(tweet, user_handle: str, user_name: str,
+                      include_raw: bool = False) -> TweetRecord:
+    """Convert an API v2 tweet into the record placed on the processing queue"""
+    pm = getattr(tweet, 'public_metrics', None) or {}
+    created = tweet.created_at
+    return TweetRecord(
+        tweet_id=str(tweet.id),
+        text=tweet.text,
+        created_at=created.isoformat() if created else None,
+        user_handle=user_handle,
+        user_name=user_name,
+        retweet_count=pm.get('retweet_count', 0),
+        like_count=pm.get('like_count', 0),
+        reply_count=pm.get('reply_count', 0),
+        raw_data=orjson.dumps(tweet.data) if include_raw else None
+    )
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """sys.intern for optional strings, so records share one copy of repeated user fields"""
+    return sys.intern(value) if value else value
+
+
+def _max_tweet_id(tweets: List[TweetRecord], since_id: str = None) -> str:
+    """Newest tweet ID among tweets and the previous since_id"""
+    ids = [int(tweet.tweet_id) for tweet in tweets]
+    if since_id:
+        ids.append(int(since_id))
+    return str(max(ids)) if ids else None
+
+
+# Twitter snowflake IDs carry their creation time: milliseconds since this epoch, shifted left 22 bits
+_SNOWFLAKE_EPOCH_MS = 1288834974657
+
+
+def _tweet_id_age(tweet_id: str) -> float:
+    """Seconds since the tweet with this ID was created"""
+    return time.time() - ((int(tweet_id) >> 22) + _SNOWFLAKE_EPOCH_MS) / 1000
+
+
+def _poll_delay(poll_interval: float, misses: int, max_factor: int = 8) -> float:
+    """Exponential backoff after empty polls, capped and jittered to spread requests"""
+    delay = min(poll_interval * 2 ** misses, poll_interval * max_factor)
+    return delay + random.uniform(0, poll_interval * 0.1)
+
+
+def _rules_digest(values) -> str:
+    """Order-independent digest of a set of stream rule values"""
+    return hashlib.blake2b('\n'.join(sorted(values)).encode(), digest_size=16).hexdigest()
+
+
+def _build_search_query(keywords: List[str]) -> str:
+    """Search query for the top 3 keywords (to stay within rate limits), excluding retweets"""
+    return ' OR '.join(f'"{kw}"' for kw in keywords[:3]) + ' -is:retweet'
+
+
+# API clients by id(), so the module-level user cache can be keyed on a hashable int
+_API_CLIENTS = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(client_id: int, username_lc: str, ttl_epoch: int):
+    """Resolve a lowercased username to (user_id, name) via the given client
+
+    ttl_epoch changes every USER_CACHE_TTL seconds, so entries naturally expire.
+    Raises LookupError for unknown users so misses aren't cached.
+    """
+    user = _API_CLIENTS[client_id].get_user(username=username_lc)
+    if not user.data:
+        raise LookupError(username_lc)
+    return user.data.id, _intern(user.data.name)
+
+
+class RateBucket:
+    """Token bucket for one API endpoint, resynced from x-rate-limit-* response headers"""
+
+    def __init__(self, capacity: int, window: float):
+        self.capacity = capacity
+        self.refill_rate = capacity / window
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, never blocking"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return False
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+
+            self.tokens -= 1
+            return True
+
+    def update_from_headers(self, headers) -> None:
+        """Adopt the server's view of the remaining quota"""
+        remaining = headers.get('x-rate-limit-remaining')
+        if remaining is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, float(remaining))
+            self.updated = now
+
+            reset = headers.get('x-rate-limit-reset')
+            if self.tokens < 1 and reset:
+                # Reset is an epoch timestamp; hold the bucket empty until then
+                self.blocked_until = now + max(0.0, int(reset) - time.time())
+
+
+class _RateTrackedClient(tweepy.Client):
+    """tweepy.Client that reports each response's rate limit headers"""
+
+    def __init__(self, *args, on_headers=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_headers = on_headers
+
+    def request(self, method, route, params=None, json=None, user_auth=False):
+        try:
+            response = super().request(method, route, params=params, json=json, user_auth=user_auth)
+        except tweepy.TooManyRequests as e:
+            if self._on_headers:
+                self._on_headers(route, e.response.headers)
+            raise
+
+        if self._on_headers:
+            self._on_headers(route, response.headers)
+        return response
+
+
+class FastSPSCQueue:
+    """Lightweight producer/consumer queue: a deque guarded by one Condition
+
+    Mirrors the put/get(timeout) surface of queue.Queue (raising queue.Empty on
+    timeout) without its extra not_full/all_tasks_done bookkeeping.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._not_empty = threading.Condition(threading.Lock())
+
+    def put(self, item) -> None:
+        with self._not_empty:
+            self._items.append(item)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float = None):
+        with self._not_empty:
+            if not block:
+                if not self._items:
+                    raise Empty
+            elif timeout is None:
+                while not self._items:
+                    self._not_empty.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._items:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+            return self._items.popleft()
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+
+class RecentIds:
+    """Bounded set of recently seen tweet IDs, evicting the oldest first"""
+
+    def __init__(self, maxlen: int, initial=()):
+        # Keep only the newest maxlen of the restored IDs, then index them in one pass
+        self._order = deque(initial, maxlen=maxlen)
+        self._ids = set(self._order)
+
+    def add(self, tweet_id: str) -> bool:
+        """Record tweet_id, returning False if it was already seen"""
+        if tweet_id in self._ids:
+            return False
+        if len(self._order) == self._order.maxlen:
+            self._ids.discard(self._order[0])
+        self._order.append(tweet_id)
+        self._ids.add(tweet_id)
+        return True
+
+    def __contains__(self, tweet_id: str) -> bool:
+        return tweet_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def order(self) -> deque:
+        """Seen IDs, oldest first (the live deque: read it, don't mutate it)"""
+        return self._order
+
+
+@dataclass
+class Source:
+    """A poll target scheduled by TwitterMonitor's single poll thread"""
+    name: str
+    fetch_fn: Callable[[Optional[str]], List[TweetRecord]]  # since_id -> records
+    interval: float
+    next_due: float = 0.0
+    since_id: Optional[str] = None
+    misses: int = 0
 
 
 class TwitterStreamListener(tweepy.StreamingClient):
-    def __init__(self, bearer_token: str, message_queue: Queue, *args, **kwargs):
+    # (time_ns, ISO string) of the last formatted receive time, shared by all listeners
+    _ts_cache = (0, "")
+    _TS_RESOLUTION_NS = 10_000_000  # 10 ms
+
+    def __init__(self, bearer_token: str, message_queue: FastSPSCQueue, *args,
+                 include_raw: bool = False, **kwargs):
         super().__init__(bearer_token, *args, **kwargs)
         self.message_queue = message_queue
+        self.include_raw = include_raw
         self.logger = logging.getLogger(__name__)
 
+    @classmethod
+    def _utc_now_iso(cls) -> str:
+        """Current UTC time as ISO text, reformatted at most once per 10 ms"""
+        now = time.time_ns()
+        cached_ns, cached_iso = cls._ts_cache
+        if now - cached_ns > cls._TS_RESOLUTION_NS:
+            cached_iso = datetime.utcfromtimestamp(now / 1e9).isoformat()
+            cls._ts_cache = (now, cached_iso)
+        return cached_iso
+
     def on_tweet(self, tweet):
         """Called when a tweet is received"""
         try:
             # Extract tweet data
-            tweet_data = {
-                'tweet_id': str(tweet.id),
-                'text': tweet.text,
-                'created_at': datetime.utcnow().isoformat(),
-                'author_id': str(tweet.author_id) if hasattr(tweet, 'author_id') else None,
-                'raw_data': tweet.data
-            }
-
-            # Add to processing queue
-            self.message_queue.put(tweet_data)
+            tweet_data = TweetRecord(
+                tweet_id=str(tweet.id),
+                text=tweet.text,
+                created_at=self._utc_now_iso(),
+                author_id=str(tweet.author_id) if hasattr(tweet, 'author_id') else None,
+                raw_data=orjson.dumps(tweet.data) if self.include_raw else None
+            )
+
+            # Add to processing queue (queue items are always lists of tweets)
+            self.message_queue.put([tweet_data])
             self.logger.info(f"Received tweet: {tweet.id}")
 
         except Exception as e:
@@ -48,57 +316,129 @@ class TwitterStreamListener(tweepy.StreamingClient):
 
 
 class TwitterMonitor:
+    # Refresh cached user lookups daily so display-name changes are picked up
+    USER_CACHE_TTL = 24 * 60 * 60
+
+    # Only the tweet fields TweetRecord extracts; extra fields cost bandwidth and parse time
+    DEFAULT_TWEET_FIELDS = ('created_at', 'public_metrics')
+
+    # Tweet IDs remembered for dedup across all poll sources
+    SEEN_IDS_MAXLEN = 2000
+
+    # Recent search rejects a since_id older than its 7-day window; drop ours a little before that
+    SINCE_ID_MAX_AGE = 7 * 24 * 60 * 60 - 60 * 60
+
+    # Per-endpoint quotas as (requests, window seconds); headers correct these at runtime
+    RATE_LIMITS = {
+        '/2/tweets/search/recent': (180, 15 * 60),
+        '/2/users/:id/tweets': (900, 15 * 60),
+    }
+
     def __init__(self, api_key: str, api_secret: str, bearer_token: str,
-                 access_token: str = None, access_secret: str = None):
-        """Initialize Twitter monitor"""
+                 access_token: str = None, access_secret: str = None,
+                 include_raw: bool = False, seen_store_path: str = None):
+        """Initialize Twitter monitor
+
+        include_raw keeps the full API payload on each record (off by default to save memory)
+        seen_store_path is a shelve file that keeps poll dedup state across restarts
+        """
         self.api_key = api_key
         self.api_secret = api_secret
         self.bearer_token = bearer_token
         self.access_token = access_token
         self.access_secret = access_secret
 
-        self.message_queue = Queue()
+        self.include_raw = include_raw
+        self.set_fields(self.DEFAULT_TWEET_FIELDS)
+        self.message_queue = FastSPSCQueue()
         self.stream_client = None
         self.api_client = None
-        self.running = False
         self.poll_thread = None
 
+        # Set by stop_polling; the scheduler waits on it so shutdown doesn't sit out a full interval
+        # (starts set: the monitor isn't polling until start_polling/start_user_polling)
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+
+        # Poll sources multiplexed onto the single poll_thread scheduler
+        self._sources: List[Source] = []
+        self._sources_lock = threading.Lock()
+
+        # Pre-empt calls that would hit the rate limit instead of sleeping inside tweepy
+        self._buckets = {
+            endpoint: RateBucket(capacity, window)
+            for endpoint, (capacity, window) in self.RATE_LIMITS.items()
+        }
+
         self.logger = logging.getLogger(__name__)
 
+        # Seen tweet IDs shared by all sources, persisted so restarts don't re-emit recent tweets
+        self._seen_lock = threading.Lock()
+        self._seen_store = None
+        seen_store_path = seen_store_path or os.getenv('TWEET_SEEN_STORE', '/app/data/tweet_seen')
+        try:
+            self._seen_store = shelve.open(seen_store_path, writeback=False)
+            atexit.register(self._seen_store.close)
+        except Exception as e:
+            self.logger.warning(f"Tweet dedup store unavailable, dedup won't survive restarts: {e}")
+        self._seen_ids = self._load_seen()
+
         # Initialize API client for user lookups
         self._init_api_client()
 
+    def set_fields(self, tweet_fields) -> None:
+        """Choose the tweet fields requested from the API
+
+        Search and stream requests always add author_id, which they need to attribute tweets.
+        """
+        self._tweet_fields = list(tweet_fields)
+        self._author_tweet_fields = list(dict.fromkeys([*self._tweet_fields, 'author_id']))
+
     def _init_api_client(self):
         """Initialize Twitter API v2 client"""
         try:
-            self.api_client = tweepy.Client(
+            self.api_client = _RateTrackedClient(
                 bearer_token=self.bearer_token,
                 consumer_key=self.api_key,
                 consumer_secret=self.api_secret,
                 access_token=self.access_token,
                 access_token_secret=self.access_secret,
-                wait_on_rate_limit=True
+                wait_on_rate_limit=False,
+                on_headers=self._update_bucket
             )
+            _API_CLIENTS[id(self.api_client)] = self.api_client
+            _resolve_cached.cache_clear()
             self.logger.info("Twitter API client initialized")
         except Exception as e:
             self.logger.error(f"Failed to initialize API client: {e}")
 
+    def _update_bucket(self, route: str, headers) -> None:
+        """Sync the matching endpoint bucket from response headers"""
+        # Only the user id varies; the /2 version prefix is part of the RATE_LIMITS key
+        endpoint = re.sub(r'/users/\d+/', '/users/:id/', route)
+        bucket = self._buckets.get(endpoint)
+        if bucket:
+            bucket.update_from_headers(headers)
+        else:
+            self.logger.debug(f"No rate bucket tracks {endpoint}")
+
+    def _acquire(self, endpoint: str) -> bool:
+        """Take a token for endpoint, logging when the call is skipped"""
+        if self._buckets[endpoint].try_acquire():
+            return True
+        self.logger.warning(f"Rate limit budget exhausted for {endpoint}, skipping this tick")
+        return False
+
     def start_stream(self, keywords: List[str], usernames: List[str] = None):
         """Start streaming tweets"""
         try:
             # Create streaming client
             self.stream_client = TwitterStreamListener(
                 self.bearer_token,
-                self.message_queue
+                self.message_queue,
+                include_raw=self.include_raw
             )
 
-            # Delete existing rules
-            rules = self.stream_client.get_rules()
-            if rules.data:
-                rule_ids = [rule.id for rule in rules.data]
-                self.stream_client.delete_rules(rule_ids)
-                self.logger.info(f"Deleted {len(rule_ids)} existing rules")
-
             # Build query
             rules_to_add = []
 
@@ -112,15 +452,32 @@ class TwitterMonitor:
                 for username in usernames:
                     rules_to_add.append(tweepy.StreamRule(f"from:{username}"))
 
-            # Add rules
-            if rules_to_add:
-                self.stream_client.add_rules(rules_to_add)
-                self.logger.info(f"Added {len(rules_to_add)} streaming rules")
+            # Only replace the server-side rules when they differ from what we want
+            want = _rules_digest(rule.value for rule in rules_to_add)
+            if self._stored_rules_digest() == want:
+                self.logger.info("Streaming rules unchanged since last start, skipping rule sync")
+            else:
+                rules = self.stream_client.get_rules()
+                if _rules_digest(rule.value for rule in rules.data or []) == want:
+                    self.logger.info("Streaming rules already up to date")
+                else:
+                    # Delete existing rules
+                    if rules.data:
+                        rule_ids = [rule.id for rule in rules.data]
+                        self.stream_client.delete_rules(rule_ids)
+                        self.logger.info(f"Deleted {len(rule_ids)} existing rules")
+
+                    # Add rules
+                    if rules_to_add:
+                        self.stream_client.add_rules(rules_to_add)
+                        self.logger.info(f"Added {len(rules_to_add)} streaming rules")
+
+                self._store_rules_digest(want)
 
             # Start filtering
             self.logger.info("Starting Twitter stream...")
             self.stream_client.filter(
-                tweet_fields=['created_at', 'public_metrics', 'author_id', 'conversation_id'],
+                tweet_fields=self._author_tweet_fields,
                 threaded=True
             )
 
@@ -128,43 +485,54 @@ class TwitterMonitor:
             self.logger.error(f"Error starting stream: {e}")
             raise
 
+    def _stored_rules_digest(self) -> Optional[str]:
+        """Digest of the rule set applied by the last start_stream, if persisted"""
+        if self._seen_store is None:
+            return None
+        with self._seen_lock:
+            return self._seen_store.get('stream_rules')
+
+    def _store_rules_digest(self, digest: str) -> None:
+        """Remember the applied rule set so restarts can skip get_rules"""
+        if self._seen_store is None:
+            return
+        with self._seen_lock:
+            self._seen_store['stream_rules'] = digest
+            self._seen_store.sync()
+
     def stop_stream(self):
         """Stop streaming"""
         if self.stream_client:
             self.stream_client.disconnect()
             self.logger.info("Stream stopped")
 
-    def search_recent_tweets(self, query: str, max_results: int = 100) -> List[Dict]:
-        """Search for recent tweets"""
+    def search_recent_tweets(self, query: str, max_results: int = 100,
+                             since_id: str = None) -> List[TweetRecord]:
+        """Search for recent tweets, optionally only those newer than since_id"""
+        if not self._acquire('/2/tweets/search/recent'):
+            return []
+
         try:
             tweets = self.api_client.search_recent_tweets(
                 query=query,
                 max_results=max_results,
-                tweet_fields=['created_at', 'public_metrics', 'author_id'],
+                tweet_fields=self._author_tweet_fields,
                 user_fields=['username', 'name'],
-                expansions=['author_id']
+                expansions=['author_id'],
+                **({'since_id': since_id} if since_id else {})
             )
 
             results = []
             if tweets.data:
-                # Create user lookup dictionary
-                users = {user.id: user for user in tweets.includes.get('users', [])}
+                # Create user lookup dictionary of interned (handle, name)
+                users = {
+                    user.id: (_intern(user.username), _intern(user.name))
+                    for user in tweets.includes.get('users', [])
+                }
 
                 for tweet in tweets.data:
-                    user = users.get(tweet.author_id)
-
-                    tweet_data = {
-                        'tweet_id': str(tweet.id),
-                        'text': tweet.text,
-                        'created_at': tweet.created_at.isoformat() if tweet.created_at else None,
-                        'user_handle': user.username if user else None,
-                        'user_name': user.name if user else None,
-                        'retweet_count': tweet.public_metrics.get('retweet_count', 0) if hasattr(tweet, 'public_metrics') else 0,
-                        'like_count': tweet.public_metrics.get('like_count', 0) if hasattr(tweet, 'public_metrics') else 0,
-                        'reply_count': tweet.public_metrics.get('reply_count', 0) if hasattr(tweet, 'public_metrics') else 0,
-                        'raw_data': tweet.data
-                    }
-                    results.append(tweet_data)
+                    user_handle, user_name = users.get(tweet.author_id, (None, None))
+                    results.append(_build_tweet_data(tweet, user_handle, user_name, self.include_raw))
 
             self.logger.info(f"Retrieved {len(results)} tweets for query: {query}")
             return results
@@ -173,40 +541,34 @@ class TwitterMonitor:
             self.logger.error(f"Error searching tweets: {e}")
             return []
 
-    def get_user_tweets(self, username: str, max_results: int = 100) -> List[Dict]:
-        """Get tweets from a specific user"""
+    def get_user_tweets(self, username: str, max_results: int = 100,
+                        since_id: str = None) -> List[TweetRecord]:
+        """Get tweets from a specific user, optionally only those newer than since_id"""
         try:
-            # Get user ID
-            user = self.api_client.get_user(username=username)
-            if not user.data:
-                self.logger.warning(f"User not found: {username}")
+            # Get user ID (cached)
+            resolved = self._resolve_user(username)
+            if not resolved:
                 return []
 
-            user_id = user.data.id
+            user_id, user_name = resolved
+            username = _intern(username)
 
             # Get tweets
+            if not self._acquire('/2/users/:id/tweets'):
+                return []
+
             tweets = self.api_client.get_users_tweets(
                 id=user_id,
                 max_results=max_results,
-                tweet_fields=['created_at', 'public_metrics'],
-                exclude=['retweets', 'replies']
+                tweet_fields=self._tweet_fields,
+                exclude=['retweets', 'replies'],
+                **({'since_id': since_id} if since_id else {})
             )
 
             results = []
             if tweets.data:
                 for tweet in tweets.data:
-                    tweet_data = {
-                        'tweet_id': str(tweet.id),
-                        'text': tweet.text,
-                        'created_at': tweet.created_at.isoformat() if tweet.created_at else None,
-                        'user_handle': username,
-                        'user_name': user.data.name,
-                        'retweet_count': tweet.public_metrics.get('retweet_count', 0) if hasattr(tweet, 'public_metrics') else 0,
-                        'like_count': tweet.public_metrics.get('like_count', 0) if hasattr(tweet, 'public_metrics') else 0,
-                        'reply_count': tweet.public_metrics.get('reply_count', 0) if hasattr(tweet, 'public_metrics') else 0,
-                        'raw_data': tweet.data
-                    }
-                    results.append(tweet_data)
+                    results.append(_build_tweet_data(tweet, username, user_name, self.include_raw))
 
             self.logger.info(f"Retrieved {len(results)} tweets from @{username}")
             return results
@@ -215,107 +577,145 @@ class TwitterMonitor:
             self.logger.error(f"Error getting user tweets: {e}")
             return []
 
-    def get_queue(self) -> Queue:
+    def _resolve_user(self, username: str):
+        """Look up (user_id, name) for a username, cached for up to USER_CACHE_TTL seconds"""
+        try:
+            return _resolve_cached(
+                id(self.api_client),
+                username.lower(),
+                int(time.time() // self.USER_CACHE_TTL)
+            )
+        except LookupError:
+            self.logger.warning(f"User not found: {username}")
+            return None
+
+    def get_queue(self) -> FastSPSCQueue:
         """Get the message queue"""
         return self.message_queue
 
+    @staticmethod
+    def _seen_key(target: str) -> str:
+        """Store key for a poll target (search query or user)"""
+        return hashlib.blake2b(target.encode(), digest_size=16).hexdigest()
+
+    def _load_seen(self) -> RecentIds:
+        """Restore the shared dedup state"""
+        if self._seen_store is None:
+            return RecentIds(self.SEEN_IDS_MAXLEN)
+        with self._seen_lock:
+            return RecentIds(self.SEEN_IDS_MAXLEN, self._seen_store.get('seen_ids', []))
+
+    def _load_since_id(self, source_name: str) -> Optional[str]:
+        """Restore the newest tweet ID polled for a source"""
+        if self._seen_store is None:
+            return None
+        with self._seen_lock:
+            return self._seen_store.get(self._seen_key(source_name))
+
+    def _save_seen(self, source: 'Source') -> None:
+        """Persist the shared dedup state and the source's since_id"""
+        if self._seen_store is None:
+            return
+        try:
+            with self._seen_lock:
+                self._seen_store['seen_ids'] = self._seen_ids.order
+                self._seen_store[self._seen_key(source.name)] = source.since_id
+                self._seen_store.sync()
+        except Exception as e:
+            self.logger.warning(f"Failed to persist tweet dedup state: {e}")
+
     def start_polling(self, keywords: List[str], poll_interval: int = 60):
         """Start polling for tweets (Free tier compatible)"""
-        self.running = True
-        self.poll_thread = threading.Thread(
-            target=self._poll_loop,
-            args=(keywords, poll_interval),
-            daemon=True
-        )
-        self.poll_thread.start()
+        # Keywords are fixed for the source's lifetime, so build the query once
+        query = _build_search_query(keywords)
+        self._add_source(Source(
+            name=query,
+            fetch_fn=lambda since_id: self.search_recent_tweets(query, max_results=10, since_id=since_id),
+            interval=poll_interval
+        ))
         self.logger.info(f"Started Twitter polling (every {poll_interval}s)")
 
-    def _poll_loop(self, keywords: List[str], poll_interval: int):
-        """Poll for tweets periodically"""
-        last_tweet_ids = set()
-
-        while self.running:
-            try:
-                # Build search query (limit to top 3 keywords to stay within rate limits)
-                query = ' OR '.join([f'"{kw}"' for kw in keywords[:3]])
-                query += ' -is:retweet'  # Exclude retweets
-
-                # Search for recent tweets (max 10 to conserve API quota)
-                tweets = self.search_recent_tweets(query, max_results=10)
-
-                # Add new tweets to queue
-                new_count = 0
-                for tweet in tweets:
-                    tweet_id = tweet['tweet_id']
-                    if tweet_id not in last_tweet_ids:
-                        self.message_queue.put(tweet)
-                        last_tweet_ids.add(tweet_id)
-                        new_count += 1
-
-                # Keep only recent 1000 IDs in memory
-                if len(last_tweet_ids) > 1000:
-                    last_tweet_ids = set(list(last_tweet_ids)[-1000:])
-
-                if new_count > 0:
-                    self.logger.info(f"Polled {new_count} new tweets")
-
-                # Sleep before next poll
-                time.sleep(poll_interval)
-
-            except Exception as e:
-                self.logger.error(f"Error in polling loop: {e}")
-                time.sleep(poll_interval)
-
-        self.logger.info("Polling stopped")
-
     def start_user_polling(self, username: str, poll_interval: int = 300):
         """Start polling for a specific user's tweets (Free tier compatible)"""
-        self.running = True
-        self.poll_thread = threading.Thread(
-            target=self._user_poll_loop,
-            args=(username, poll_interval),
-            daemon=True
-        )
-        self.poll_thread.start()
+        self._add_source(Source(
+            name=f"from:{username}",
+            fetch_fn=lambda since_id: self.get_user_tweets(username, max_results=10, since_id=since_id),
+            interval=poll_interval
+        ))
         self.logger.info(f"Started user polling for @{username} (every {poll_interval}s)")
 
-    def _user_poll_loop(self, username: str, poll_interval: int):
-        """Poll for a specific user's tweets periodically"""
-        last_tweet_ids = set()
+    def _add_source(self, source: 'Source') -> None:
+        """Register a poll source with the scheduler, starting it if needed"""
+        source.since_id = self._load_since_id(source.name)
 
-        while self.running:
-            try:
-                # Get tweets from specific user (much more efficient than keyword search)
-                tweets = self.get_user_tweets(username, max_results=10)
+        # A scheduler told to stop exits within a second; let it finish before restarting
+        if self._stop_event.is_set() and self.poll_thread and self.poll_thread.is_alive():
+            self.poll_thread.join()
 
-                # Add new tweets to queue
-                new_count = 0
-                for tweet in tweets:
-                    tweet_id = tweet['tweet_id']
-                    if tweet_id not in last_tweet_ids:
-                        self.message_queue.put(tweet)
-                        last_tweet_ids.add(tweet_id)
-                        new_count += 1
+        with self._sources_lock:
+            self._sources.append(source)
+            self._stop_event.clear()
+            if not (self.poll_thread and self.poll_thread.is_alive()):
+                self.poll_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+                self.poll_thread.start()
 
-                # Keep only recent 500 IDs in memory
-                if len(last_tweet_ids) > 500:
-                    last_tweet_ids = set(list(last_tweet_ids)[-500:])
+    def _scheduler_loop(self):
+        """Run every registered source when it falls due, one at a time"""
+        while not self._stop_event.is_set():
+            with self._sources_lock:
+                source = min(self._sources, key=lambda src: src.next_due, default=None)
 
-                if new_count > 0:
-                    self.logger.info(f"Polled {new_count} new tweets from @{username}")
+            # Re-check at least every second so newly added sources get picked up
+            delay = source.next_due - time.monotonic() if source else 1.0
+            if delay > 0:
+                if self._stop_event.wait(min(delay, 1.0)):
+                    break
+                continue
 
-                # Sleep before next poll
-                time.sleep(poll_interval)
+            self._poll_source(source)
 
-            except Exception as e:
-                self.logger.error(f"Error in user polling loop: {e}")
-                time.sleep(poll_interval)
+        self.logger.info("Polling stopped")
+
+    def _poll_source(self, source: 'Source'):
+        """Fetch one source, queue unseen tweets and schedule its next run"""
+        try:
+            # A since_id outside the search window would be rejected on every poll and never advance;
+            # restart from the window (the shared seen IDs filter any repeats)
+            if source.since_id and _tweet_id_age(source.since_id) > self.SINCE_ID_MAX_AGE:
+                self.logger.info(f"Dropping stale since_id for {source.name}")
+                source.since_id = None
+
+            # Only ask for tweets newer than the last poll
+            tweets = source.fetch_fn(source.since_id)
+            source.since_id = _max_tweet_id(tweets, source.since_id)
+
+            # Add new tweets to queue as a single batch
+            new_tweets = [tweet for tweet in tweets if self._seen_ids.add(tweet.tweet_id)]
+            if new_tweets:
+                self.message_queue.put(new_tweets)
+                self._save_seen(source)
+                self.logger.info(f"Polled {len(new_tweets)} new tweets for {source.name}")
+                source.misses = 0
+            else:
+                source.misses += 1
+
+            # Back off while the source is quiet
+            source.next_due = time.monotonic() + _poll_delay(source.interval, source.misses)
+
+        except Exception as e:
+            self.logger.error(f"Error polling {source.name}: {e}")
+            source.next_due = time.monotonic() + source.interval
 
-        self.logger.info("User polling stopped")
+    @property
+    def running(self) -> bool:
+        """True while polling hasn't been stopped"""
+        return not self._stop_event.is_set()
 
     def stop_polling(self):
-        """Stop polling"""
-        self.running = False
+        """Stop polling and drop all sources, waking the scheduler if it is waiting"""
+        self._stop_event.set()
+        with self._sources_lock:
+            self._sources.clear()
         self.logger.info("Stopping Twitter polling...")
 
 
@@ -1,18 +1,338 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
+from flask_compress import Compress
 import plotly.graph_objs as go
-import plotly.utils
+from plotly.utils import PlotlyJSONEncoder
 import json
-from datetime import datetime, timedelta
+import orjson
+import functools
+import hashlib
+from types import MappingProxyType
+from urllib.parse import parse_qs
+import numpy as np
+from scipy import sparse
+from datetime import datetime, timedelta, timezone
 import logging
 import os
+import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from message_queue import MessageQueue
+from _downsample import lttb_indices
 from crypto_predictor import CryptoPredictor
 
 
+def _lttb(points: list, threshold: int, x_key: str = 'timestamp', y_key: str = 'avg_sentiment') -> list:
+    """Downsample time series rows with LTTB, keeping whole rows so other columns stay aligned"""
+    if len(points) <= threshold:
+        return points
+
+    x = np.array([p[x_key] for p in points], dtype='datetime64[s]').astype(np.float64)
+    y = np.array([p[y_key] or 0.0 for p in points], dtype=np.float64)
+    return [points[i] for i in lttb_indices(x, y, threshold)]
+
+
+def _shared_keyword_pairs(keyword_sets: list) -> list:
+    """(i, j, shared count) for every pair i < j of keyword sets that overlap
+
+    Counts come from one sparse item x keyword incidence product instead of pairwise set intersections.
+    """
+    vocab = {}
+    rows = []
+    cols = []
+    for i, keywords in enumerate(keyword_sets):
+        for kw in keywords:
+            rows.append(i)
+            cols.append(vocab.setdefault(kw, len(vocab)))
+
+    if not rows:
+        return []
+
+    incidence = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(keyword_sets), len(vocab))
+    )
+    shared = sparse.triu(incidence @ incidence.T, k=1).tocoo()
+
+    # Row-major order, matching a nested i < j loop
+    order = np.lexsort((shared.col, shared.row))
+    return [
+        (int(i), int(j), int(count))
+        for i, j, count in zip(shared.row[order], shared.col[order], shared.data[order])
+        if count > 0
+    ]
+
+
+def _sentiment_point(tweet: dict):
+    """Minimal sentiment chart delta for a new tweet, or None if it has no usable score/time"""
+    score = tweet.get('sentiment_score')
+    created_at = tweet.get('created_at')
+    if score is None or not created_at:
+        return None
+    try:
+        dt = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        return None
+    # Match SQLite's datetime(created_at), which the chart's x values come from
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return {
+        'timestamp': dt.strftime('%Y-%m-%d %H:%M:%S'),
+        'sentiment': score,
+        'category': tweet.get('category')
+    }
+
+
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _ojson(obj) -> Response:
+    """JSON response encoded with orjson (much faster than jsonify on large payloads)"""
+    return Response(orjson.dumps(obj, option=_ORJSON_OPTS), mimetype='application/json')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so every jsonify() and request.get_json() uses it"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Types orjson lacks (Decimal, UUID, ...) fall back to Flask's own conversions
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Plotly's own conversions for anything orjson has no native encoding for (pandas, Decimal, ...)
+_plotly_default = PlotlyJSONEncoder().default
+
+
+def _plotly_json(data: list, layout: dict) -> bytes:
+    """Plotly figure JSON from plain trace dicts and a prebuilt layout, skipping go.Figure validation"""
+    return orjson.dumps({'data': data, 'layout': layout}, default=_plotly_default, option=_ORJSON_OPTS)
+
+
+def _prebuilt_layout(**layout) -> dict:
+    """Validated layout (default template included) as a plain dict; built once at import, never per request"""
+    return go.Figure(layout=layout).to_plotly_json()['layout']
+
+
+_SENTIMENT_LAYOUT = _prebuilt_layout(
+    xaxis_title='Time',
+    yaxis_title='Sentiment Score',
+    hovermode='x unified',
+    plot_bgcolor='white',
+    yaxis=dict(range=[-1, 1]),
+    # Dashed zero line
+    shapes=[dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+                 line=dict(color='gray', dash='dash'), opacity=0.5)]
+)
+_WORD_FREQUENCY_LAYOUT = _prebuilt_layout(
+    xaxis_title='Keywords',
+    yaxis_title='Frequency',
+    plot_bgcolor='white',
+    xaxis_tickangle=-45
+)
+_CATEGORY_LAYOUT = _prebuilt_layout(
+    title='Tweet Distribution by Category',
+    plot_bgcolor='white'
+)
+_CRYPTO_LAYOUT = _prebuilt_layout(
+    title='Crypto Prices (Real-time WebSocket)',
+    xaxis_title='Symbol',
+    yaxis_title='Price (USDT)',
+    plot_bgcolor='white',
+    yaxis_type='log',  # Log scale for better visualization
+    showlegend=False
+)
+
+
+_EMPTY_CHART = orjson.dumps({'data': [], 'layout': {}})
+
+
+def _etag(body: bytes) -> str:
+    """Short content hash used as a strong ETag"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _held_etag(etag: str):
+    """The client's If-None-Match tag for this version, if it sent one"""
+    for tag in request.if_none_match.as_set():
+        # flask-compress re-tags encoded bodies as "<etag>:<algorithm>"
+        if tag == etag or tag.startswith(etag + ':'):
+            return tag
+    return None
+
+
+def _not_modified(tag: str) -> Response:
+    """Empty 304 echoing the tag the client revalidated with"""
+    response = Response(status=304)
+    response.set_etag(tag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _etag_response(body: bytes, etag: str) -> Response:
+    """JSON response tagged with etag, or an empty 304 when the client already holds that version"""
+    tag = _held_etag(etag)
+    if tag is not None:
+        return _not_modified(tag)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+# (epoch second, its local ISO string, its "Mon DD, YYYY" date); swapped as one tuple so readers never see a torn set
+_now_cache = (0, '', '')
+
+
+def _now_stamps() -> tuple:
+    """(ISO 8601, "Mon DD, YYYY") for local now at one-second resolution, formatted at most once per second"""
+    global _now_cache
+    second = int(time.time())
+    cached = _now_cache
+    if second != cached[0]:
+        now = datetime.fromtimestamp(second)
+        cached = (second, now.isoformat(), now.strftime("%b %d, %Y"))
+        _now_cache = cached
+    return cached[1], cached[2]
+
+
+def _now_iso() -> str:
+    """Local time as ISO 8601 at one-second resolution"""
+    return _now_stamps()[0]
+
+
+# Canonical time windows; requests are widened to the nearest one so nearby windows share cache keys
+_HOUR_BUCKETS = (1, 6, 12, 24, 72, 168)
+
+
+def _quantize_hours(hours: int, max_hours: int = 24 * 365) -> int:
+    """Smallest canonical window >= hours; longer windows ("all time") round up to a power of two"""
+    hours = max(1, min(hours, max_hours))
+    for bucket in _HOUR_BUCKETS:
+        if hours <= bucket:
+            return bucket
+    return 1 << (hours - 1).bit_length()
+
+
+# Query params that must parse as integers; anything else is passed through as a string
+_INT_PARAMS = frozenset({'hours', 'limit', 'max_points', 'min_articles', 'min_keyword_count',
+                         'keywords_per_entity', 'entity_limit'})
+# Integer params are clamped into this range so absurd values never reach the database
+_INT_MIN, _INT_MAX = 1, 10_000
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_query(query_string: bytes):
+    """(typed params, error) for a raw query string, parsed once per distinct string"""
+    params = {}
+    for name, values in parse_qs(query_string.decode('utf-8', 'replace'), keep_blank_values=True).items():
+        value = values[0]
+        if name in _INT_PARAMS:
+            if not value:
+                continue  # blank means "use the route's default"
+            try:
+                value = max(_INT_MIN, min(int(value), _INT_MAX))
+            except ValueError:
+                return MappingProxyType({}), f"Query parameter '{name}' must be an integer"
+        params[name] = value
+    return MappingProxyType(params), None
+
+
+def _qp(name: str, default=None):
+    """Typed query parameter for the current request (ints are validated up front by _check_query)"""
+    return _parse_query(request.query_string)[0].get(name, default)
+
+
+def ttl_cache(key: str, ttl: int = 5):
+    """Cache a WebApp method's JSON-serializable result in Redis for ttl seconds
+
+    Concurrent callers that miss the cache wait for the first caller's result instead of recomputing it.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            redis_key = f"cache:{key}"
+            client = self.mq.redis_client
+            if client is not None:
+                try:
+                    cached = client.get(redis_key)
+                    if cached is not None:
+                        return json.loads(cached)
+                except Exception as e:
+                    self.logger.warning(f"Redis cache read failed for {redis_key}: {e}")
+
+            with self._inflight_lock:
+                event = self._inflight.get(key)
+                leader = event is None
+                if leader:
+                    event = self._inflight[key] = threading.Event()
+
+            if not leader:
+                event.wait()
+                if isinstance(event.result, Exception):
+                    raise event.result
+                return event.result
+
+            try:
+                event.result = method(self)
+                if client is not None:
+                    try:
+                        client.setex(redis_key, ttl, json.dumps(event.result))
+                    except Exception as e:
+                        self.logger.warning(f"Redis cache write failed for {redis_key}: {e}")
+                return event.result
+            except Exception as e:
+                event.result = e
+                raise
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[key]
+                event.set()
+        return wrapper
+    return decorator
+
+
 class WebApp:
+    # How often the background worker rebuilds the default dashboard charts and entity snapshots
+    CHART_REFRESH_SECONDS = 30
+    ENTITY_REFRESH_SECONDS = 60
+    # Worker message types that make charts stale; those charts are rebuilt within
+    # CHART_REBUILD_SECONDS of the message instead of waiting for their next refresh
+    # (their routes' Redis TTL matches, so a cached copy is never older than a rebuild)
+    CHART_TRIGGERS = {
+        'new_tweet': ('sentiment', 'word_frequency', 'category_distribution'),
+        'crypto_update': ('crypto',),
+    }
+    CHART_REBUILD_SECONDS = 2
+    # Entity snapshot variants kept warm: the common time windows and entity types
+    SNAPSHOT_HOURS = (1, 6, 24)
+    SNAPSHOT_ENTITY_TYPES = (None, 'PERSON', 'ORG', 'GPE')
+    # Upper bound on sub-requests accepted by /api/batch
+    BATCH_MAX_PATHS = 20
+    # Series longer than this are drawn with WebGL (Scattergl) instead of SVG
+    WEBGL_MIN_POINTS = 500
+    # Worker message type -> Socket.IO event its batches are sent as; bursts are drained for up to
+    # BROADCAST_WINDOW seconds (at most BROADCAST_MAX_BATCH messages) into one list per event
+    BROADCAST_EVENTS = {
+        'new_tweet': 'new_tweet_batch',
+        'new_alert': 'new_alert_batch',
+        'stats_update': 'stats_update_batch',
+        'crypto_update': 'crypto_update_batch',
+        'forex_event': 'forex_event_batch',
+    }
+    BROADCAST_MAX_BATCH = 200
+    BROADCAST_WINDOW = 0.010
+    # Snapshot-style message types where only the latest in a burst matters -> field that
+    # identifies a snapshot (None: the whole type collapses to its last message)
+    BROADCAST_COALESCE = {
+        'stats_update': None,
+        'crypto_update': 'symbol',
+    }
+
     def __init__(self, db, binance_monitor=None, rss_monitor=None, news_intelligence=None, port=8080):
         """Initialize Flask web application with Redis hub"""
         self.db = db
@@ -28,16 +348,23 @@ class WebApp:
                          template_folder='../templates',
                          static_folder='../static')
         self.app.config['SECRET_KEY'] = 'twitter-sentiment-bot-secret-key'
+        self.app.json = OrjsonProvider(self.app)
 
         CORS(self.app)
 
-        # Configure Socket.IO with Redis message queue for hub architecture
+        # Brotli (or gzip) for JSON bodies worth compressing; chart and tweet payloads shrink 5-10x
+        self.app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        self.app.config['COMPRESS_MIN_SIZE'] = 1024
+        Compress(self.app)
+
         redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
+
+        # Socket.IO delivers straight to this process's clients: every hub process subscribes to the
+        # worker channels itself (see _start_redis_subscriber), so no Redis client manager is needed
         self.socketio = SocketIO(
             self.app,
             cors_allowed_origins="*",
-            message_queue=redis_url,  # Enable Redis adapter for multi-server support
-            async_mode='threading'
+            async_mode=os.getenv('SOCKETIO_ASYNC_MODE', 'threading')  # 'gevent' under Gunicorn
         )
 
         self.logger = logging.getLogger(__name__)
@@ -45,15 +372,117 @@ class WebApp:
         # Initialize message queue for subscribing to worker updates
         self.mq = MessageQueue(redis_url)
 
+        # Per-key events for ttl_cache, so concurrent misses share one computation
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # In-process callbacks by worker message type, fed by the hub's single Redis subscription
+        self._pubsub_router = {}
+
+        # (JSON body, ETag) kept warm by a background worker, keyed by (chart name, *params);
+        # worker messages mark the charts they affect dirty so the worker rebuilds them early
+        self._chart_cache = {}
+        self._chart_lock = threading.RLock()
+        self._chart_dirty = set()
+        for msg_type, names in self.CHART_TRIGGERS.items():
+            self.add_message_handler(msg_type, functools.partial(self._mark_charts_dirty, names))
+
         # Start Redis subscription thread
         self._start_redis_subscriber()
 
+        self.socketio.start_background_task(self._precompute_loop)
+
+        # /api/batch sub-requests, with identical in-flight paths sharing one future
+        self._batch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="batch")
+        self._batch_inflight = {}
+        self._batch_lock = threading.Lock()
+
         # Register routes
         self._register_routes()
 
+    def _redis_cached(self, ttl: int = 30):
+        """Cache a view's JSON body in Redis, keyed on the endpoint, its path args and (bucketed) query args"""
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                client = self.mq.redis_client
+                if client is None:
+                    return view(*args, **kwargs)
+
+                params = dict(_parse_query(request.query_string)[0])
+                if 'hours' in params:
+                    params['hours'] = _quantize_hours(params['hours'])
+                params.update(request.view_args or {})
+                key = f"cache:{request.endpoint}:" + '&'.join(
+                    f"{name}={params[name]}" for name in sorted(params)
+                )
+
+                try:
+                    cached = client.get(key)
+                    if cached is not None:
+                        body = cached.encode('utf-8')
+                        return _etag_response(body, _etag(body))
+                except Exception as e:
+                    self.logger.warning(f"Redis cache read failed for {key}: {e}")
+
+                response = view(*args, **kwargs)
+                # Streamed bodies go out as they are built; buffering them here would defeat the stream
+                if (isinstance(response, Response) and response.status_code == 200
+                        and not response.is_streamed):
+                    body = response.get_data()
+                    try:
+                        client.setex(key, ttl, body)
+                    except Exception as e:
+                        self.logger.warning(f"Redis cache write failed for {key}: {e}")
+                return response
+            return wrapper
+        return decorator
+
+    def _batch_get(self, path: str):
+        """Future for the JSON body of GET path, shared with any identical request still in flight"""
+        with self._batch_lock:
+            future = self._batch_inflight.get(path)
+            if future is not None:
+                return future
+            future = self._batch_pool.submit(lambda: self.app.test_client().get(path).get_json())
+            self._batch_inflight[path] = future
+
+        # Outside the lock: the callback runs immediately if the future has already finished
+        future.add_done_callback(lambda f: self._batch_forget(path, f))
+        return future
+
+    def _batch_forget(self, path: str, future):
+        with self._batch_lock:
+            if self._batch_inflight.get(path) is future:
+                del self._batch_inflight[path]
+
     def _register_routes(self):
         """Register Flask routes"""
 
+        @self.app.before_request
+        def _check_query():
+            """Reject malformed integer query params with a 400 before any route runs"""
+            error = _parse_query(request.query_string)[1]
+            if error:
+                return jsonify({'error': error}), 400
+
+        @self.app.after_request
+        def _tag_json(response):
+            """ETag every buffered JSON GET so a poll that finds nothing new comes back as an empty 304"""
+            if (request.method != 'GET' or response.status_code != 200
+                    or response.is_streamed or response.mimetype != 'application/json'):
+                return response
+            etag = response.get_etag()[0]
+            if etag is None:
+                etag = _etag(response.get_data())
+                response.set_etag(etag)
+            tag = _held_etag(etag)
+            if tag is not None:
+                return _not_modified(tag)
+            # Stored, but revalidated on every poll; the 304 keeps that cheap
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+
         @self.app.route('/')
         def index():
             """Main dashboard"""
@@ -73,7 +502,7 @@ class WebApp:
         def get_stats():
             """Get dashboard statistics"""
             try:
-                stats = self.db.get_dashboard_stats()
+                stats = self._dashboard_stats()
                 return jsonify(stats)
             except Exception as e:
                 self.logger.error(f"Error getting stats: {e}")
@@ -83,24 +512,32 @@ class WebApp:
         def get_tweets():
             """Get recent tweets"""
             try:
-                category = request.args.get('category', None)
-                hours = request.args.get('hours', None)
-                hours = int(hours) if hours else None
-                limit = int(request.args.get('limit', 100))
+                category = _qp('category')
+                hours = _qp('hours') or None
+                limit = _qp('limit', 100)
+
+                tweets = self.db.iter_recent_tweets(category=category, hours=hours, limit=limit)
+
+                # Encode rows as the cursor yields them instead of materializing the whole list
+                def generate():
+                    yield b'['
+                    for i, tweet in enumerate(tweets):
+                        yield (b',' if i else b'') + orjson.dumps(tweet, option=_ORJSON_OPTS)
+                    yield b']'
 
-                tweets = self.db.get_recent_tweets(category=category, hours=hours, limit=limit)
-                return jsonify(tweets)
+                return Response(generate(), mimetype='application/json')
             except Exception as e:
                 self.logger.error(f"Error getting tweets: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/wordcloud')
+        @self._redis_cached(ttl=5)
         def get_wordcloud():
             """Get word frequency data for word cloud"""
             try:
-                category = request.args.get('category', None)
-                hours = int(request.args.get('hours', 24))
-                limit = int(request.args.get('limit', 100))
+                category = _qp('category')
+                hours = _quantize_hours(_qp('hours', 24))
+                limit = _qp('limit', 100)
 
                 words = self.db.get_word_frequency_stats(
                     category=category,
@@ -117,11 +554,12 @@ class WebApp:
         def get_sentiment_timeseries():
             """Get sentiment time series data"""
             try:
-                category = request.args.get('category', None)
-                hours = int(request.args.get('hours', 24))
+                category = _qp('category')
+                hours = _quantize_hours(_qp('hours', 24))
+                max_points = _qp('max_points', 800)
 
                 data = self.db.get_sentiment_time_series(category=category, hours=hours)
-                return jsonify(data)
+                return jsonify(_lttb(data, max_points))
             except Exception as e:
                 self.logger.error(f"Error getting time series: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -130,13 +568,30 @@ class WebApp:
         def get_alerts():
             """Get recent alerts"""
             try:
-                limit = int(request.args.get('limit', 50))
-                alerts = self.db.get_alerts(limit=limit)
+                limit = _qp('limit', 50)
+                alert_type = _qp('type')
+                alerts = self.db.get_alerts(limit=limit, alert_type=alert_type)
                 return jsonify(alerts)
             except Exception as e:
                 self.logger.error(f"Error getting alerts: {e}")
                 return jsonify({'error': str(e)}), 500
 
+        @self.app.route('/api/batch', methods=['POST'])
+        def batch():
+            """Run several GET /api/* requests in one round-trip, returns {path: body}"""
+            try:
+                paths = request.get_json(silent=True)
+                if (not isinstance(paths, list) or len(paths) > self.BATCH_MAX_PATHS
+                        or not all(isinstance(p, str) and p.startswith('/api/') and not p.startswith('/api/batch')
+                                   for p in paths)):
+                    return jsonify({'error': f'Expected a list of up to {self.BATCH_MAX_PATHS} /api/ paths'}), 400
+
+                futures = {path: self._batch_get(path) for path in paths}
+                return jsonify({path: future.result() for path, future in futures.items()})
+            except Exception as e:
+                self.logger.error(f"Error running batch request: {e}")
+                return jsonify({'error': str(e)}), 500
+
         @self.app.route('/api/forex/calendar')
         def get_forex_calendar():
             """Get Forex Factory calendar events for current week"""
@@ -148,158 +603,57 @@ class WebApp:
                 # For now, return empty data - will be populated by forex monitoring thread
                 # This endpoint will be used to fetch stored forex events from alerts table
 
-                # Get recent forex calendar alerts
-                all_alerts = self.db.get_alerts(limit=200)
-                forex_alerts = [a for a in all_alerts if a.get('alert_type') == 'forex_calendar']
-
-                # Sort by event date (extract from message)
-                def get_event_date(alert):
-                    try:
-                        # Extract date from message (format: "Date: Thursday, October 16, 2025")
-                        message = alert.get('message', '')
-                        for line in message.split('\n'):
-                            if line.startswith('Date:'):
-                                date_str = line.replace('Date:', '').strip()
-                                # Remove TODAY/TOMORROW prefix if present
-                                if '(' in date_str:
-                                    date_str = date_str.split('(')[1].replace(')', '')
-                                # Parse date
-                                return datetime.strptime(date_str, '%A, %B %d, %Y')
-                    except:
-                        pass
-                    # Fallback to created_at
-                    return datetime.fromisoformat(alert.get('created_at', datetime.now().isoformat()))
-
-                forex_alerts_sorted = sorted(forex_alerts, key=get_event_date)
+                # Forex calendar alerts, already sorted by event date in SQL
+                forex_alerts = self.db.get_forex_alerts(limit=50)
+                now_iso, week = _now_stamps()
 
                 return jsonify({
-                    'week': datetime.now().strftime("%b %d, %Y"),
-                    'last_updated': datetime.now().isoformat(),
-                    'events': forex_alerts_sorted[:50]  # Return up to 50 forex events
+                    'week': week,
+                    'last_updated': now_iso,
+                    'events': forex_alerts  # Up to 50 forex events
                 })
             except Exception as e:
                 self.logger.error(f"Error getting forex calendar: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/visualizations/sentiment-chart')
+        @self._redis_cached(ttl=self.CHART_REBUILD_SECONDS)
         def sentiment_chart():
             """Generate sentiment time series chart"""
             try:
-                category = request.args.get('category', None)
-                hours = int(request.args.get('hours', 24))
+                category = _qp('category')
+                hours = _quantize_hours(_qp('hours', 24))
+                max_points = _qp('max_points', 800)
 
-                data = self.db.get_sentiment_time_series(category=category, hours=hours)
-
-                if not data:
-                    return jsonify({'data': [], 'layout': {}})
-
-                # Create Plotly chart
-                timestamps = [d['timestamp'] for d in data]
-                sentiments = [d['avg_sentiment'] for d in data]
-                counts = [d['tweet_count'] for d in data]
-
-                fig = go.Figure()
-
-                # Sentiment line
-                fig.add_trace(go.Scatter(
-                    x=timestamps,
-                    y=sentiments,
-                    mode='lines+markers',
-                    name='Sentiment Score',
-                    line=dict(color='blue', width=2),
-                    hovertemplate='%{x}<br>Sentiment: %{y:.2f}<extra></extra>'
-                ))
-
-                # Add zero line
-                fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
-
-                fig.update_layout(
-                    title=f'Sentiment Over Time - {category.upper() if category else "All"}',
-                    xaxis_title='Time',
-                    yaxis_title='Sentiment Score',
-                    hovermode='x unified',
-                    plot_bgcolor='white',
-                    yaxis=dict(range=[-1, 1])
-                )
-
-                return jsonify(json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)))
+                return self._chart_response('sentiment', self._build_sentiment_chart,
+                                            category, hours, max_points)
 
             except Exception as e:
                 self.logger.error(f"Error creating sentiment chart: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/visualizations/word-frequency')
+        @self._redis_cached(ttl=self.CHART_REBUILD_SECONDS)
         def word_frequency_chart():
             """Generate word frequency bar chart"""
             try:
-                category = request.args.get('category', None)
-                hours = int(request.args.get('hours', 24))
-                limit = int(request.args.get('limit', 100))
+                category = _qp('category')
+                hours = _quantize_hours(_qp('hours', 24))
+                limit = _qp('limit', 100)
 
-                words = self.db.get_word_frequency_stats(
-                    category=category,
-                    hours=hours,
-                    limit=limit
-                )
-
-                if not words:
-                    return jsonify({'data': [], 'layout': {}})
-
-                # Create bar chart
-                word_list = [w['word'] for w in words]
-                counts = [w['count'] for w in words]
-
-                fig = go.Figure(data=[
-                    go.Bar(
-                        x=word_list,
-                        y=counts,
-                        marker_color='lightblue',
-                        hovertemplate='%{x}<br>Count: %{y}<extra></extra>'
-                    )
-                ])
-
-                fig.update_layout(
-                    title=f'Top Keywords - {category.upper() if category else "All"}',
-                    xaxis_title='Keywords',
-                    yaxis_title='Frequency',
-                    plot_bgcolor='white',
-                    xaxis_tickangle=-45
-                )
-
-                return jsonify(json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)))
+                return self._chart_response('word_frequency', self._build_word_frequency_chart,
+                                            category, hours, limit)
 
             except Exception as e:
                 self.logger.error(f"Error creating word frequency chart: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/visualizations/category-distribution')
+        @self._redis_cached(ttl=self.CHART_REBUILD_SECONDS)
         def category_distribution():
             """Generate category distribution pie chart"""
             try:
-                stats = self.db.get_dashboard_stats()
-                tweets_by_cat = stats.get('tweets_by_category', [])
-
-                if not tweets_by_cat:
-                    return jsonify({'data': [], 'layout': {}})
-
-                categories = [c['category'] for c in tweets_by_cat]
-                counts = [c['count'] for c in tweets_by_cat]
-
-                fig = go.Figure(data=[
-                    go.Pie(
-                        labels=categories,
-                        values=counts,
-                        hole=0.3,
-                        hovertemplate='%{label}<br>Count: %{value}<br>%{percent}<extra></extra>'
-                    )
-                ])
-
-                fig.update_layout(
-                    title='Tweet Distribution by Category',
-                    plot_bgcolor='white'
-                )
-
-                return jsonify(json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)))
+                return self._chart_response('category_distribution', self._build_category_distribution)
 
             except Exception as e:
                 self.logger.error(f"Error creating category distribution chart: {e}")
@@ -312,77 +666,18 @@ class WebApp:
                 if not self.binance_monitor:
                     return jsonify({'error': 'Binance monitor not available'}), 503
 
-                status = self.binance_monitor.get_current_status()
+                status = self._crypto_status()
                 return jsonify(status)
             except Exception as e:
                 self.logger.error(f"Error getting crypto prices: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/visualizations/crypto-chart')
+        @self._redis_cached(ttl=self.CHART_REBUILD_SECONDS)
         def crypto_chart():
             """Generate crypto price chart"""
             try:
-                if not self.binance_monitor:
-                    return jsonify({'data': [], 'layout': {}})
-
-                status = self.binance_monitor.get_current_status()
-
-                if not status:
-                    return jsonify({'data': [], 'layout': {}})
-
-                # Create chart with current prices and changes
-                symbols = []
-                prices = []
-                changes = []
-                colors = []
-                price_labels = []
-
-                for symbol, data in status.items():
-                    symbols.append(symbol.replace('USDT', ''))
-                    price = data['current_price']
-                    prices.append(price)
-                    change = data.get('change_percent', 0)
-                    changes.append(change if change else 0)
-                    colors.append('green' if change and change > 0 else 'red' if change and change < 0 else 'gray')
-
-                    # Format price based on magnitude (show more decimals for small prices)
-                    # Also include the percentage change
-                    change_sign = '+' if change > 0 else ''
-                    change_str = f'{change_sign}{change:.2f}%' if change else '0.00%'
-
-                    if price < 0.01:
-                        price_labels.append(f'${price:.8f}\n{change_str}')  # 8 decimals for very small prices like PEPE
-                    elif price < 1:
-                        price_labels.append(f'${price:.6f}\n{change_str}')  # 6 decimals for small prices
-                    elif price < 100:
-                        price_labels.append(f'${price:.4f}\n{change_str}')  # 4 decimals for medium prices
-                    else:
-                        price_labels.append(f'${price:,.2f}\n{change_str}')  # 2 decimals for large prices
-
-                fig = go.Figure()
-
-                # Price bars
-                fig.add_trace(go.Bar(
-                    x=symbols,
-                    y=prices,
-                    name='Current Price',
-                    marker_color=colors,
-                    text=price_labels,
-                    textposition='auto',
-                    hovertemplate='%{x}<br>Price: %{text}<br>Change: %{customdata:.2f}%<extra></extra>',
-                    customdata=changes
-                ))
-
-                fig.update_layout(
-                    title='Crypto Prices (Real-time WebSocket)',
-                    xaxis_title='Symbol',
-                    yaxis_title='Price (USDT)',
-                    plot_bgcolor='white',
-                    yaxis_type='log',  # Log scale for better visualization
-                    showlegend=False
-                )
-
-                return jsonify(json.loads(json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)))
+                return self._chart_response('crypto', self._build_crypto_chart)
 
             except Exception as e:
                 self.logger.error(f"Error creating crypto chart: {e}")
@@ -394,13 +689,13 @@ class WebApp:
             try:
                 # Get predictions for major cryptos
                 symbols = ['BTC', 'ETH', 'SOL', 'BNB', 'XRP']
-                timeframe = request.args.get('timeframe', '6h')
+                timeframe = _qp('timeframe', '6h')
 
                 predictions = self.crypto_predictor.predict_multiple_cryptos(symbols, timeframe)
 
                 return jsonify({
                     'predictions': predictions,
-                    'generated_at': datetime.now().isoformat(),
+                    'generated_at': _now_iso(),
                     'timeframe': timeframe
                 })
             except Exception as e:
@@ -411,7 +706,7 @@ class WebApp:
         def crypto_prediction_single(symbol):
             """Get price prediction for a specific crypto"""
             try:
-                timeframe = request.args.get('timeframe', '6h')
+                timeframe = _qp('timeframe', '6h')
                 prediction = self.crypto_predictor.predict_price_movement(symbol, timeframe)
 
                 return jsonify(prediction)
@@ -423,7 +718,7 @@ class WebApp:
         def crypto_sentiment_trend(symbol):
             """Get sentiment trend analysis for a crypto"""
             try:
-                hours = int(request.args.get('hours', 24))
+                hours = _quantize_hours(_qp('hours', 24))
                 trend = self.crypto_predictor.get_sentiment_trend(symbol, hours)
 
                 return jsonify(trend)
@@ -433,19 +728,19 @@ class WebApp:
 
         @self.app.route('/api/admin/refresh-rss', methods=['POST'])
         def refresh_rss():
-            """Force refresh all RSS feeds"""
+            """Queue an RSS refresh and return without waiting for the fetch"""
             try:
-                if not self.rss_monitor:
-                    return jsonify({'error': 'RSS monitor not available'}), 503
-
-                # Trigger immediate RSS fetch
                 self.logger.info("Admin triggered RSS refresh")
-                self.rss_monitor.fetch_all_feeds()
+                if self.rss_monitor:
+                    # Only resets the feed timers; the monitor thread fetches on its next pass
+                    self.rss_monitor.fetch_all_feeds()
+                elif not self.mq.publish_control('refresh_rss'):
+                    return jsonify({'error': 'RSS monitor not available'}), 503
 
                 return jsonify({
-                    'status': 'success',
-                    'message': 'RSS feeds refreshed successfully'
-                })
+                    'status': 'accepted',
+                    'message': 'RSS refresh queued'
+                }), 202
             except Exception as e:
                 self.logger.error(f"Error refreshing RSS feeds: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -474,8 +769,8 @@ class WebApp:
         def get_keyword_articles(keyword):
             """Get news articles for a specific keyword"""
             try:
-                hours = int(request.args.get('hours', 24))
-                limit = int(request.args.get('limit', 50))
+                hours = _quantize_hours(_qp('hours', 24))
+                limit = _qp('limit', 50)
 
                 articles = self.db.get_tweets_by_keyword(
                     keyword=keyword,
@@ -483,7 +778,7 @@ class WebApp:
                     limit=limit
                 )
 
-                return jsonify({
+                return _ojson({
                     'keyword': keyword,
                     'count': len(articles),
                     'articles': articles
@@ -496,8 +791,8 @@ class WebApp:
         def get_entity_articles(entity_text):
             """Get news articles for a specific entity"""
             try:
-                hours = int(request.args.get('hours', 24))
-                limit = int(request.args.get('limit', 50))
+                hours = _qp('hours', 24)
+                limit = _qp('limit', 50)
 
                 articles = self.db.get_entity_timeline(
                     entity_text=entity_text,
@@ -507,7 +802,7 @@ class WebApp:
                 # Limit results
                 articles = articles[:limit]
 
-                return jsonify({
+                return _ojson({
                     'entity': entity_text,
                     'count': len(articles),
                     'articles': articles
@@ -520,16 +815,16 @@ class WebApp:
         def advanced_search():
             """Advanced search with multiple filters"""
             try:
-                query = request.args.get('q', '')
-                category = request.args.get('category', None)
+                query = _qp('q', '')
+                category = _qp('category')
                 if category == 'all':
                     category = None
-                hours = int(request.args.get('hours', 24))
-                sentiment = request.args.get('sentiment', None)
+                hours = _quantize_hours(_qp('hours', 24))
+                sentiment = _qp('sentiment')
                 if sentiment == 'all':
                     sentiment = None
-                sort_by = request.args.get('sort', 'relevance')
-                limit = int(request.args.get('limit', 100))
+                sort_by = _qp('sort', 'relevance')
+                limit = _qp('limit', 100)
 
                 # Search articles
                 articles = self.db.search_articles(
@@ -540,76 +835,82 @@ class WebApp:
                     limit=limit
                 )
 
-                # Calculate analytics
-                if articles:
-                    sentiments = [a.get('sentiment_score', 0) for a in articles if a.get('sentiment_score') is not None]
-                    avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-
-                    sources = set([a.get('user_handle') for a in articles if a.get('user_handle')])
-                    unique_sources = len(sources)
-
-                    # Get time span
-                    timestamps = [a.get('created_at') for a in articles if a.get('created_at')]
-                    time_span = 'N/A'
-                    if timestamps:
-                        try:
-                            first = min(timestamps)
-                            last = max(timestamps)
-                            first_dt = datetime.fromisoformat(first) if isinstance(first, str) else first
-                            last_dt = datetime.fromisoformat(last) if isinstance(last, str) else last
-                            diff = last_dt - first_dt
-                            hours_span = diff.total_seconds() / 3600
-                            if hours_span < 1:
-                                time_span = f"{int(diff.total_seconds() / 60)}m"
-                            elif hours_span < 24:
-                                time_span = f"{int(hours_span)}h"
-                            else:
-                                time_span = f"{int(hours_span / 24)}d"
-                        except:
-                            pass
-                else:
-                    avg_sentiment = 0
-                    unique_sources = 0
-                    time_span = 'N/A'
+                # Calculate analytics in one pass over the articles
+                scores = []
+                sources = set()
+                timestamps = []
+                for a in articles:
+                    score = a.get('sentiment_score')
+                    if score is not None:
+                        scores.append(score)
+                    if a.get('user_handle'):
+                        sources.add(a['user_handle'])
+                    if a.get('created_at'):
+                        timestamps.append(a['created_at'])
+
+                avg_sentiment = float(np.mean(scores)) if scores else 0
+                unique_sources = len(sources)
+
+                # Get time span
+                time_span = 'N/A'
+                if timestamps:
+                    try:
+                        ts = np.array(timestamps, dtype='datetime64[s]')
+                        seconds = int((ts.max() - ts.min()).astype(int))
+                        hours_span = seconds / 3600
+                        if hours_span < 1:
+                            time_span = f"{int(seconds / 60)}m"
+                        elif hours_span < 24:
+                            time_span = f"{int(hours_span)}h"
+                        else:
+                            time_span = f"{int(hours_span / 24)}d"
+                    except:
+                        pass
 
-                return jsonify({
+                head = orjson.dumps({
                     'query': query,
                     'total': len(articles),
-                    'articles': articles,
                     'analytics': {
                         'avg_sentiment': round(avg_sentiment, 2),
                         'unique_sources': unique_sources,
                         'time_span': time_span
                     }
                 })
+
+                # Stream the article list so encoding overlaps with sending
+                def generate():
+                    yield head[:-1] + b',"articles":['
+                    for i, article in enumerate(articles):
+                        yield (b',' if i else b'') + orjson.dumps(article, option=_ORJSON_OPTS)
+                    yield b']}'
+
+                return Response(generate(), mimetype='application/json')
             except Exception as e:
                 self.logger.error(f"Error in advanced search: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/source-network')
+        @self._redis_cached(ttl=30)
         def source_network():
             """Get source-keyword network data"""
             try:
-                category = request.args.get('category', None)
-                hours = int(request.args.get('hours', 2))
+                category = _qp('category')
+                hours = _quantize_hours(_qp('hours', 2))
 
                 # Get recent tweets with their sources
                 tweets = self.db.get_recent_tweets(category=category, limit=200)
 
+                # Fetch keywords for all tweets in one query
+                tweet_keywords = self.db.get_tweet_keywords_bulk(
+                    [tweet.get('tweet_id') for tweet in tweets], hours=hours
+                )
+
                 # Build source-keyword mapping
                 source_keywords = {}
                 for tweet in tweets:
                     source = tweet.get('user_handle', 'Unknown')
-                    tweet_id = tweet.get('tweet_id')
-
-                    # Get keywords for this tweet
-                    keywords = self.db.get_tweet_keywords(tweet_id, hours=hours)
-
-                    if source not in source_keywords:
-                        source_keywords[source] = set()
-
-                    for kw in keywords:
-                        source_keywords[source].add(kw.get('word', ''))
+                    keywords = tweet_keywords.get(tweet.get('tweet_id'), [])
+                    source_keywords.setdefault(source, set()).update(kw or '' for kw in keywords)
 
                 # Build network graph data
                 nodes = []
@@ -625,24 +926,17 @@ class WebApp:
                         'keywords': len(source_keywords[source])
                     })
 
-                # Calculate similarity between sources
-                for i in range(len(source_list)):
-                    for j in range(i + 1, len(source_list)):
-                        source1 = source_list[i]
-                        source2 = source_list[j]
-
-                        # Find shared keywords
-                        shared = source_keywords[source1] & source_keywords[source2]
-
-                        if len(shared) > 0:  # Only create link if they share keywords
-                            links.append({
-                                'source': source1,
-                                'target': source2,
-                                'value': len(shared),
-                                'keywords': list(shared)[:5]  # Top 5 shared keywords
-                            })
+                # Link sources that share keywords; only overlapping pairs get a set intersection
+                keyword_sets = [source_keywords[source] for source in source_list]
+                for i, j, count in _shared_keyword_pairs(keyword_sets):
+                    links.append({
+                        'source': source_list[i],
+                        'target': source_list[j],
+                        'value': count,
+                        'keywords': list(keyword_sets[i] & keyword_sets[j])[:5]  # Top 5 shared keywords
+                    })
 
-                return jsonify({
+                return _ojson({
                     'nodes': nodes,
                     'links': links
                 })
@@ -653,14 +947,15 @@ class WebApp:
 
         # News Intelligence API Endpoints
         @self.app.route('/api/intelligence/trends')
+        @self._redis_cached(ttl=60)
         def intelligence_trends():
             """Get current trending topics with momentum analysis"""
             try:
                 if not self.news_intelligence:
                     return jsonify({'error': 'News intelligence service not available'}), 503
 
-                hours = int(request.args.get('hours', 6))
-                min_articles = int(request.args.get('min_articles', 3))
+                hours = _quantize_hours(_qp('hours', 6))
+                min_articles = _qp('min_articles', 3)
 
                 # Detect trending topics with error handling
                 try:
@@ -674,7 +969,7 @@ class WebApp:
 
                 return jsonify({
                     'trends': trending,
-                    'generated_at': datetime.now().isoformat(),
+                    'generated_at': _now_iso(),
                     'time_window': f'{hours}h'
                 })
             except Exception as e:
@@ -682,6 +977,7 @@ class WebApp:
                 return jsonify({'error': 'Failed to load trending topics'}), 500
 
         @self.app.route('/api/intelligence/briefing/<brief_type>')
+        @self._redis_cached(ttl=300)
         def intelligence_briefing(brief_type):
             """Get news briefing (morning, midday, evening, day, week)"""
             try:
@@ -695,7 +991,7 @@ class WebApp:
 
                 return jsonify({
                     'briefing': brief,
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': _now_iso()
                 })
             except Exception as e:
                 self.logger.error(f"Error generating briefing: {e}")
@@ -709,7 +1005,7 @@ class WebApp:
                     return jsonify({'error': 'News intelligence service not available'}), 503
 
                 # Get last visit timestamp from query param or default to 24h ago
-                last_visit_str = request.args.get('last_visit')
+                last_visit_str = _qp('last_visit')
                 if last_visit_str:
                     last_visit = datetime.fromisoformat(last_visit_str)
                 else:
@@ -719,20 +1015,21 @@ class WebApp:
 
                 return jsonify({
                     'changes': changes,
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': _now_iso()
                 })
             except Exception as e:
                 self.logger.error(f"Error calculating what changed: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/intelligence/tldr/<keyword>')
+        @self._redis_cached(ttl=300)
         def intelligence_tldr(keyword):
             """Get TL;DR summary for a specific topic"""
             try:
                 if not self.news_intelligence:
                     return jsonify({'error': 'News intelligence service not available'}), 503
 
-                hours = int(request.args.get('hours', 24))
+                hours = _quantize_hours(_qp('hours', 24))
                 articles = self.db.get_tweets_by_keyword(keyword, hours=hours, limit=10)
 
                 if not articles:
@@ -751,97 +1048,68 @@ class WebApp:
                     'keyword': keyword,
                     'tldr': tldr,
                     'article_count': len(articles),
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': _now_iso()
                 })
             except Exception as e:
                 self.logger.error(f"Error generating TL;DR: {e}")
                 return jsonify({'error': str(e)}), 500
 
-        @self.app.route('/api/intelligence/sources/<keyword>')
-        def intelligence_sources(keyword):
-            """Compare how different sources cover a topic"""
-            try:
-                if not self.news_intelligence:
-                    return jsonify({'error': 'News intelligence service not available'}), 503
-
-                hours = int(request.args.get('hours', 24))
-                comparison = self.news_intelligence.compare_sources(keyword, hours=hours)
-
-                return jsonify({
-                    'comparison': comparison,
-                    'generated_at': datetime.now().isoformat()
-                })
-            except Exception as e:
-                self.logger.error(f"Error comparing sources: {e}")
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/api/intelligence/story-thread/<keyword>')
-        def intelligence_story_thread(keyword):
-            """Get story thread analysis for a developing story"""
-            try:
-                if not self.news_intelligence:
-                    return jsonify({'error': 'News intelligence service not available'}), 503
-
-                hours = int(request.args.get('hours', 48))
-                thread = self.news_intelligence.detect_story_threads(keyword, hours=hours)
+        # Per-keyword analyses that share one shape: ?hours window in, {key: result, generated_at} out
+        # (path, endpoint, news_intelligence method, result key, default hours, error log label)
+        keyword_analyses = [
+            ('/api/intelligence/sources/<keyword>', 'intelligence_sources',
+             'compare_sources', 'comparison', 24, 'comparing sources'),
+            ('/api/intelligence/story-thread/<keyword>', 'intelligence_story_thread',
+             'detect_story_threads', 'thread', 48, 'analyzing story thread'),
+            ('/api/intelligence/trend-momentum/<keyword>', 'intelligence_trend_momentum',
+             'calculate_trend_momentum', 'momentum', 6, 'calculating momentum'),
+        ]
+
+        def keyword_analysis_view(method, key, default_hours, label):
+            def view(keyword):
+                try:
+                    if not self.news_intelligence:
+                        return jsonify({'error': 'News intelligence service not available'}), 503
 
-                return jsonify({
-                    'thread': thread,
-                    'generated_at': datetime.now().isoformat()
-                })
-            except Exception as e:
-                self.logger.error(f"Error analyzing story thread: {e}")
-                return jsonify({'error': str(e)}), 500
+                    hours = _quantize_hours(_qp('hours', default_hours))
+                    result = getattr(self.news_intelligence, method)(keyword, hours=hours)
 
-        @self.app.route('/api/intelligence/trend-momentum/<keyword>')
-        def intelligence_trend_momentum(keyword):
-            """Get momentum analysis for a specific keyword"""
-            try:
-                if not self.news_intelligence:
-                    return jsonify({'error': 'News intelligence service not available'}), 503
-
-                hours = int(request.args.get('hours', 6))
-                momentum = self.news_intelligence.calculate_trend_momentum(keyword, hours=hours)
+                    return jsonify({
+                        key: result,
+                        'generated_at': _now_iso()
+                    })
+                except Exception as e:
+                    self.logger.error(f"Error {label}: {e}")
+                    return jsonify({'error': str(e)}), 500
+            return view
 
-                return jsonify({
-                    'momentum': momentum,
-                    'generated_at': datetime.now().isoformat()
-                })
-            except Exception as e:
-                self.logger.error(f"Error calculating momentum: {e}")
-                return jsonify({'error': str(e)}), 500
+        for path, endpoint, method, key, default_hours, label in keyword_analyses:
+            view = keyword_analysis_view(method, key, default_hours, label)
+            view.__name__ = endpoint
+            self.app.add_url_rule(path, endpoint, self._redis_cached(ttl=60)(view))
 
         # Entity Recognition API Endpoints
         @self.app.route('/api/entities/trending')
+        @self._redis_cached(ttl=30)
         def entities_trending():
             """Get trending entities (people, companies, locations)"""
             try:
-                hours = int(request.args.get('hours', 24))
-                entity_type = request.args.get('type', None)  # PERSON, ORG, GPE, etc.
-                limit = int(request.args.get('limit', 50))
-
-                entities = self.db.get_trending_entities(
-                    hours=hours,
-                    entity_type=entity_type,
-                    limit=limit
-                )
+                hours = _quantize_hours(_qp('hours', 24))
+                entity_type = _qp('type')  # PERSON, ORG, GPE, etc.
+                limit = _qp('limit', 50)
 
-                return jsonify({
-                    'entities': entities,
-                    'count': len(entities),
-                    'hours': hours,
-                    'entity_type': entity_type,
-                    'generated_at': datetime.now().isoformat()
-                })
+                return self._chart_response('entities_trending', self._build_entities_trending,
+                                            hours, entity_type, limit)
             except Exception as e:
                 self.logger.error(f"Error getting trending entities: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/entities/timeline/<entity_text>')
+        @self._redis_cached(ttl=30)
         def entities_timeline(entity_text):
             """Get timeline of articles mentioning a specific entity"""
             try:
-                hours = int(request.args.get('hours', 168))  # Default 1 week
+                hours = _quantize_hours(_qp('hours', 168))  # Default 1 week
 
                 timeline = self.db.get_entity_timeline(entity_text, hours=hours)
 
@@ -850,18 +1118,19 @@ class WebApp:
                     'timeline': timeline,
                     'count': len(timeline),
                     'hours': hours,
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': _now_iso()
                 })
             except Exception as e:
                 self.logger.error(f"Error getting entity timeline: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/entities/by-category/<category>')
+        @self._redis_cached(ttl=30)
         def entities_by_category(category):
             """Get entities grouped by type for a specific category"""
             try:
-                hours = int(request.args.get('hours', 24))
-                limit = int(request.args.get('limit', 30))
+                hours = _quantize_hours(_qp('hours', 24))
+                limit = _qp('limit', 30)
 
                 entities = self.db.get_entities_by_category(
                     category=category,
@@ -873,37 +1142,26 @@ class WebApp:
                     'category': category,
                     'entities': entities,
                     'hours': hours,
-                    'generated_at': datetime.now().isoformat()
+                    'generated_at': _now_iso()
                 })
             except Exception as e:
                 self.logger.error(f"Error getting entities by category: {e}")
                 return jsonify({'error': str(e)}), 500
 
         @self.app.route('/api/entities/network')
+        @self._redis_cached(ttl=30)
         def entities_network():
             """Get entity-keyword network data for visualization (entities with linked keywords)"""
             try:
-                hours = int(request.args.get('hours', 24))
-                entity_type = request.args.get('type', None)
-                min_keyword_count = int(request.args.get('min_keyword_count', 3))
-                entity_limit = int(request.args.get('entity_limit', 20))
-                keywords_per_entity = int(request.args.get('keywords_per_entity', 10))
-
-                network_data = self.db.get_entity_network(
-                    hours=hours,
-                    entity_type=entity_type,
-                    min_keyword_count=min_keyword_count,
-                    entity_limit=entity_limit,
-                    keywords_per_entity=keywords_per_entity
-                )
-
-                return jsonify({
-                    'nodes': network_data['nodes'],
-                    'links': network_data['links'],
-                    'hours': hours,
-                    'entity_type': entity_type,
-                    'generated_at': datetime.now().isoformat()
-                })
+                hours = _quantize_hours(_qp('hours', 24))
+                entity_type = _qp('type')
+                min_keyword_count = _qp('min_keyword_count', 3)
+                entity_limit = _qp('entity_limit', 20)
+                keywords_per_entity = _qp('keywords_per_entity', 10)
+
+                return self._streamed_response('entities_network', self._iter_entities_network,
+                                               hours, entity_type, min_keyword_count, entity_limit,
+                                               keywords_per_entity)
             except Exception as e:
                 self.logger.error(f"Error getting entity network: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -919,19 +1177,265 @@ class WebApp:
             """Handle WebSocket disconnection"""
             self.logger.info('Client disconnected')
 
+    def _chart_response(self, name: str, build_fn, *params) -> Response:
+        """Serve a precomputed chart or snapshot if the background worker has one, else build it now"""
+        with self._chart_lock:
+            entry = self._chart_cache.get((name,) + params)
+        if entry is not None:
+            return _etag_response(*entry)
+        return Response(build_fn(*params), mimetype='application/json')
+
+    def _streamed_response(self, name: str, iter_fn, *params) -> Response:
+        """Like _chart_response, but stream the body chunk by chunk when it has to be built now"""
+        with self._chart_lock:
+            entry = self._chart_cache.get((name,) + params)
+        if entry is not None:
+            return _etag_response(*entry)
+        return Response(iter_fn(*params), mimetype='application/json')
+
+    def _chart_jobs(self):
+        """(name, build_fn, param variants, refresh seconds) the background worker keeps warm"""
+        hours_and_types = [(hours, entity_type)
+                           for hours in self.SNAPSHOT_HOURS for entity_type in self.SNAPSHOT_ENTITY_TYPES]
+        return [
+            ('sentiment', self._build_sentiment_chart, [(None, _quantize_hours(24), 800)],
+             self.CHART_REFRESH_SECONDS),
+            ('word_frequency', self._build_word_frequency_chart, [(None, _quantize_hours(24), 100)],
+             self.CHART_REFRESH_SECONDS),
+            ('category_distribution', self._build_category_distribution, [()], self.CHART_REFRESH_SECONDS),
+            ('crypto', self._build_crypto_chart, [()], self.CHART_REFRESH_SECONDS),
+            # Route defaults: limit=50; the dashboard network uses min_keyword_count=3, 20 entities, 10 keywords
+            ('entities_trending', self._build_entities_trending,
+             [(hours, entity_type, 50) for hours, entity_type in hours_and_types],
+             self.ENTITY_REFRESH_SECONDS),
+            ('entities_network', self._build_entities_network,
+             [(24, entity_type, 3, 20, 10) for entity_type in self.SNAPSHOT_ENTITY_TYPES],
+             self.ENTITY_REFRESH_SECONDS),
+        ]
+
+    def _mark_charts_dirty(self, names, data=None):
+        """Message handler: have the background worker rebuild these charts on its next pass"""
+        with self._chart_lock:
+            self._chart_dirty.update(names)
+
+    def _precompute_loop(self):
+        """Rebuild each job's variants when its refresh interval has elapsed or a worker message made it stale"""
+        last_run = {}
+        while True:
+            now = time.monotonic()
+            with self._chart_lock:
+                dirty, self._chart_dirty = self._chart_dirty, set()
+            for name, build_fn, variants, every in self._chart_jobs():
+                if name not in dirty and now - last_run.get(name, float('-inf')) < every:
+                    continue
+                last_run[name] = now
+                for params in variants:
+                    try:
+                        body = build_fn(*params)
+                    except Exception as e:
+                        self.logger.error(f"Error precomputing {name} chart: {e}")
+                        continue
+                    with self._chart_lock:
+                        self._chart_cache[(name,) + params] = (body, _etag(body))
+            self.socketio.sleep(self.CHART_REBUILD_SECONDS)
+
+    @ttl_cache(key='dashboard_stats', ttl=5)
+    def _dashboard_stats(self) -> dict:
+        """Dashboard aggregates, shared across requests for a few seconds"""
+        return self.db.get_dashboard_stats()
+
+    @ttl_cache(key='crypto_status', ttl=5)
+    def _crypto_status(self) -> dict:
+        """Binance monitor status, shared across requests for a few seconds"""
+        return self.binance_monitor.get_current_status()
+
+    def _build_entities_trending(self, hours, entity_type, limit) -> bytes:
+        """Trending entities payload as JSON"""
+        entities = self.db.get_trending_entities(
+            hours=hours,
+            entity_type=entity_type,
+            limit=limit
+        )
+
+        return orjson.dumps({
+            'entities': entities,
+            'count': len(entities),
+            'hours': hours,
+            'entity_type': entity_type,
+            'generated_at': _now_iso()
+        }, option=_ORJSON_OPTS)
+
+    def _iter_entities_network(self, hours, entity_type, min_keyword_count, entity_limit,
+                               keywords_per_entity):
+        """Entity-keyword network payload as JSON chunks: nodes and links are encoded one at a time
+
+        The query runs eagerly so database errors surface to the caller, not mid-stream
+        """
+        network_data = self.db.get_entity_network(
+            hours=hours,
+            entity_type=entity_type,
+            min_keyword_count=min_keyword_count,
+            entity_limit=entity_limit,
+            keywords_per_entity=keywords_per_entity
+        )
+
+        tail = orjson.dumps({
+            'hours': hours,
+            'entity_type': entity_type,
+            'generated_at': _now_iso()
+        })
+
+        def generate():
+            yield b'{"nodes":['
+            for i, node in enumerate(network_data['nodes']):
+                yield (b',' if i else b'') + orjson.dumps(node, option=_ORJSON_OPTS)
+            yield b'],"links":['
+            for i, link in enumerate(network_data['links']):
+                yield (b',' if i else b'') + orjson.dumps(link, option=_ORJSON_OPTS)
+            yield b'],' + tail[1:]
+
+        return generate()
+
+    def _build_entities_network(self, *params) -> bytes:
+        """Entity-keyword network payload as JSON"""
+        return b''.join(self._iter_entities_network(*params))
+
+    def _build_sentiment_chart(self, category, hours, max_points) -> bytes:
+        """Sentiment time series chart as Plotly JSON"""
+        data = self.db.get_sentiment_time_series(category=category, hours=hours)
+
+        if not data:
+            return _EMPTY_CHART
+
+        # Roughly one point per pixel column is all the chart can show
+        data = _lttb(data, max_points)
+
+        # Create Plotly chart
+        timestamps = [d['timestamp'] for d in data]
+        sentiments = [d['avg_sentiment'] for d in data]
+        counts = [d['tweet_count'] for d in data]
+
+        # Sentiment line; long series render through WebGL without per-point markers
+        large = len(timestamps) > self.WEBGL_MIN_POINTS
+        trace = {
+            'type': 'scattergl' if large else 'scatter',
+            'x': timestamps,
+            'y': sentiments,
+            'mode': 'lines' if large else 'lines+markers',
+            'name': 'Sentiment Score',
+            'line': {'color': 'blue', 'width': 2},
+            'hovertemplate': '%{x}<br>Sentiment: %{y:.2f}<extra></extra>',
+            'customdata': counts  # per-point tweet counts, used by clients to fold in sentiment_delta
+        }
+        layout = {**_SENTIMENT_LAYOUT,
+                  'title': {'text': f'Sentiment Over Time - {category.upper() if category else "All"}'}}
+
+        return _plotly_json([trace], layout)
+
+    def _build_word_frequency_chart(self, category, hours, limit) -> bytes:
+        """Word frequency bar chart as Plotly JSON"""
+        words = self.db.get_word_frequency_stats(
+            category=category,
+            hours=hours,
+            limit=limit
+        )
+
+        if not words:
+            return _EMPTY_CHART
+
+        # Create bar chart
+        word_list = [w['word'] for w in words]
+        counts = [w['count'] for w in words]
+
+        trace = {
+            'type': 'bar',
+            'x': word_list,
+            'y': counts,
+            'marker': {'color': 'lightblue'},
+            'hovertemplate': '%{x}<br>Count: %{y}<extra></extra>'
+        }
+        layout = {**_WORD_FREQUENCY_LAYOUT,
+                  'title': {'text': f'Top Keywords - {category.upper() if category else "All"}'}}
+
+        return _plotly_json([trace], layout)
+
+    def _build_category_distribution(self) -> bytes:
+        """Category distribution pie chart as Plotly JSON"""
+        stats = self._dashboard_stats()
+        tweets_by_cat = stats.get('tweets_by_category', [])
+
+        if not tweets_by_cat:
+            return _EMPTY_CHART
+
+        categories = [c['category'] for c in tweets_by_cat]
+        counts = [c['count'] for c in tweets_by_cat]
+
+        trace = {
+            'type': 'pie',
+            'labels': categories,
+            'values': counts,
+            'hole': 0.3,
+            'hovertemplate': '%{label}<br>Count: %{value}<br>%{percent}<extra></extra>'
+        }
+
+        return _plotly_json([trace], _CATEGORY_LAYOUT)
+
+    def _build_crypto_chart(self) -> bytes:
+        """Crypto price chart as Plotly JSON"""
+        if not self.binance_monitor:
+            return _EMPTY_CHART
+
+        status = self._crypto_status()
+
+        if not status:
+            return _EMPTY_CHART
+
+        # Create chart with current prices and changes
+        symbols = []
+        prices = []
+        changes = []
+        colors = []
+
+        for symbol, data in status.items():
+            symbols.append(symbol.replace('USDT', ''))
+            prices.append(data['current_price'])
+            change = data.get('change_percent', 0)
+            changes.append(change if change else 0)
+            colors.append('green' if change and change > 0 else 'red' if change and change < 0 else 'gray')
+
+        # Price bars
+        trace = {
+            'type': 'bar',
+            'x': symbols,
+            'y': prices,
+            'name': 'Current Price',
+            'marker': {'color': colors},
+            # Formatted in the browser; 6 significant digits keeps tiny prices like PEPE readable
+            'texttemplate': '%{y:$,.6~r}<br>%{customdata:+.2f}%',
+            'textposition': 'auto',
+            'hovertemplate': '%{x}<br>Price: %{y:$,.6~r}<br>Change: %{customdata:+.2f}%<extra></extra>',
+            'customdata': changes
+        }
+
+        return _plotly_json([trace], _CRYPTO_LAYOUT)
+
     def _start_redis_subscriber(self):
         """Start background thread to subscribe to Redis channels"""
         def redis_subscriber():
+            threading.current_thread().name = 'redis-sub'
             self.logger.info("🔄 Starting Redis subscriber thread...")
 
-            # Subscribe to all worker channels
-            pubsub = self.mq.subscribe(
-                MessageQueue.CHANNEL_TWEETS,
-                MessageQueue.CHANNEL_ALERTS,
-                MessageQueue.CHANNEL_STATS,
-                MessageQueue.CHANNEL_CRYPTO,
-                MessageQueue.CHANNEL_FOREX
-            )
+            # Optionally keep the broadcast producer on one core (Linux; pid 0 = this thread)
+            cpu = os.getenv('REDIS_SUB_CPU')
+            if cpu and hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {int(cpu)})
+                except (ValueError, OSError) as e:
+                    self.logger.warning(f"Could not pin Redis subscriber to CPU {cpu}: {e}")
+
+            # One pattern subscription covers every worker channel, including ones added later;
+            # what gets broadcast is still decided by message type (BROADCAST_EVENTS)
+            pubsub = self.mq.psubscribe(MessageQueue.CHANNEL_PATTERN)
 
             if not pubsub:
                 self.logger.error("Failed to subscribe to Redis channels")
@@ -939,43 +1443,76 @@ class WebApp:
 
             self.logger.info("✅ Redis subscriber ready, listening for worker updates...")
 
-            # Listen for messages and broadcast to all clients
+            # Block until a message arrives, drain the rest of the burst, broadcast one batch per event type
             while True:
                 try:
-                    message = self.mq.get_message(pubsub, timeout=1.0)
-
-                    if message:
-                        msg_type = message.get('type')
-                        data = message.get('data')
-
-                        # Broadcast to all connected Socket.IO clients
-                        if msg_type == 'new_tweet':
-                            self.socketio.emit('new_tweet', data)
-                            self.logger.debug(f"📤 Broadcasted new_tweet to all clients")
-
-                        elif msg_type == 'new_alert':
-                            self.socketio.emit('new_alert', data)
-                            self.logger.debug(f"📤 Broadcasted new_alert to all clients")
-
-                        elif msg_type == 'stats_update':
-                            self.socketio.emit('stats_update', data)
-                            self.logger.debug(f"📤 Broadcasted stats_update to all clients")
-
-                        elif msg_type == 'crypto_update':
-                            self.socketio.emit('crypto_update', data)
-                            self.logger.debug(f"📤 Broadcasted crypto_update to all clients")
-
-                        elif msg_type == 'forex_event':
-                            self.socketio.emit('forex_event', data)
-                            self.logger.debug(f"📤 Broadcasted forex_event to all clients")
-
+                    for message in self.mq.listen(pubsub):
+                        try:
+                            self._broadcast_burst(pubsub, message)
+                        except Exception as e:
+                            self.logger.error(f"Error broadcasting worker update: {e}")
                 except Exception as e:
+                    # Connection dropped; listen() reconnects and resubscribes on the next call
                     self.logger.error(f"Error in Redis subscriber: {e}")
-                    # Continue listening even if there's an error
-
-        # Start subscriber thread
-        subscriber_thread = threading.Thread(target=redis_subscriber, daemon=True)
-        subscriber_thread.start()
+                    self.socketio.sleep(1)
+
+        # A thread in threading mode, a greenlet under gevent/eventlet
+        self.socketio.start_background_task(redis_subscriber)
+
+    def add_message_handler(self, msg_type: str, callback):
+        """
+        Call callback(data) for every worker message of msg_type
+
+        Runs on the subscriber thread, so callbacks must be quick. Use this instead of opening
+        another Redis subscription: the hub keeps exactly one pubsub connection per process.
+        """
+        self._pubsub_router.setdefault(msg_type, []).append(callback)
+
+    def _broadcast_burst(self, pubsub, message: dict):
+        """Send message plus whatever else is already queued as one '<event>_batch' emit per type"""
+        events = self.BROADCAST_EVENTS
+        coalesce = self.BROADCAST_COALESCE
+        buckets = {}
+        latest = {}  # event -> {snapshot key: last data} for coalesced types
+        drained = 0
+        deadline = time.monotonic() + self.BROADCAST_WINDOW
+        while message:
+            msg_type = message.get('type')
+            event = events.get(msg_type)
+            data = message.get('data')
+            for callback in self._pubsub_router.get(msg_type, ()):
+                try:
+                    callback(data)
+                except Exception as e:
+                    self.logger.error(f"Error in {msg_type} handler: {e}")
+            if event and msg_type in coalesce:
+                field = coalesce[msg_type]
+                key = data.get(field) if field and isinstance(data, dict) else None
+                latest.setdefault(event, {})[key] = data
+            elif event:
+                buckets.setdefault(event, []).append(data)
+                if msg_type == 'new_tweet':
+                    # Clients patch the sentiment chart in place instead of refetching it
+                    point = _sentiment_point(data)
+                    if point:
+                        buckets.setdefault('sentiment_delta_batch', []).append(point)
+
+            drained += 1
+            if drained >= self.BROADCAST_MAX_BATCH or time.monotonic() > deadline:
+                break
+            message = self.mq.get_message(pubsub, timeout=0)
+
+        for event, snapshots in latest.items():
+            buckets[event] = list(snapshots.values())
+
+        # Broadcast to this process's Socket.IO clients straight through the python-socketio manager,
+        # which encodes each packet once and writes the same frame to every participant
+        manager = self.socketio.server.manager
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for event, items in buckets.items():
+            manager.emit(event, items, namespace='/')
+            if debug:
+                self.logger.debug(f"📤 Broadcasted {len(items)} {event} to all clients")
 
     # OLD METHODS REMOVED - Now workers publish to Redis, hub broadcasts to clients
     # def emit_new_tweet(), emit_new_alert(), emit_stats_update(), emit_crypto_update()
@@ -985,4 +1522,22 @@ class WebApp:
         """Run the Flask application"""
         self.logger.info(f"🚀 Starting web server on port {self.port}")
         self.logger.info(f"🎯 Hub architecture enabled - broadcasting updates from Redis")
-        self.socketio.run(self.app, host='0.0.0.0', port=self.port, debug=False, allow_unsafe_werkzeug=True)
+        # gevent/eventlet modes serve through their own WSGI server; only the threading fallback
+        # runs on Werkzeug, which is fine for a single-box deployment but not for the public hub
+        threading_mode = self.socketio.async_mode == 'threading'
+        if threading_mode:
+            self.logger.warning("Serving with Werkzeug; run create_app() under Gunicorn for production")
+        self.socketio.run(self.app, host='0.0.0.0', port=self.port, debug=False,
+                          allow_unsafe_werkzeug=threading_mode)
+
+
+def create_app():
+    """Standalone hub for Gunicorn's gevent websocket worker (see README for the command)
+
+    Workers (main.py) publish to Redis; each Gunicorn process subscribes and serves its own clients.
+    """
+    from database import Database
+
+    web_app = WebApp(db=Database(os.getenv('DATABASE_PATH', '/app/data/twitter_bot.db')),
+                     port=int(os.getenv('PORT', 8080)))
+    return web_app.app
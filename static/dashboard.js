@@ -20,7 +20,6 @@ function debounce(func, wait) {
 
 // Debounced reload functions (wait 2 seconds before executing)
 const debouncedLoadStats = debounce(loadStats, 2000);
-const debouncedLoadSentimentChart = debounce(loadSentimentChart, 2000);
 const debouncedLoadWordFrequencyChart = debounce(loadWordFrequencyChart, 2000);
 const debouncedLoadCategoryChart = debounce(loadCategoryChart, 2000);
 const debouncedLoadLatestKeywords = debounce(loadLatestKeywords, 2000);
@@ -31,13 +30,12 @@ document.addEventListener('DOMContentLoaded', function() {
     // Initialize WebSocket connection
     initializeWebSocket();
 
-    // Load initial data
-    loadStats();
+    // Load initial data (fixed-URL panels share one /api/batch round-trip)
+    loadInitialBatch();
     loadTweets();
-    loadAlerts();
     createEntityNetwork(); // Load entity network
-    loadCharts();
-    loadForexCalendar();
+    loadSentimentChart();
+    loadWordFrequencyChart();
     loadLatestKeywords();
 
     // Setup category filter buttons
@@ -64,33 +62,41 @@ function initializeWebSocket() {
         updateConnectionStatus(false);
     });
 
-    socket.on('new_tweet', function(data) {
-        addNewTweet(data);
-
-        // Add keywords to latest keywords display
-        if (data.keywords && data.keywords.length > 0) {
-            addLatestKeywords(data.keywords, data.category);
-        }
-
-        // Update visualizations using debounced functions (prevents too many requests)
-        debouncedLoadStats();
-        debouncedLoadSentimentChart();
-        debouncedLoadWordFrequencyChart();
-        debouncedLoadCategoryChart();
-    });
+    // The hub sends each event type as a '<event>_batch' list; dispatch every item
+    const handlers = {
+        new_tweet: function(data) {
+            addNewTweet(data);
 
-    socket.on('new_alert', function(data) {
-        addNewAlert(data);
-        debouncedLoadStats();
-    });
+            // Add keywords to latest keywords display
+            if (data.keywords && data.keywords.length > 0) {
+                addLatestKeywords(data.keywords, data.category);
+            }
 
-    socket.on('stats_update', function(data) {
-        updateStats(data);
-    });
+            // Update visualizations using debounced functions (prevents too many requests)
+            debouncedLoadStats();
+            debouncedLoadWordFrequencyChart();
+            debouncedLoadCategoryChart();
+        },
+        sentiment_delta: function(point) {
+            applySentimentDelta(point);
+        },
+        new_alert: function(data) {
+            addNewAlert(data);
+            debouncedLoadStats();
+        },
+        stats_update: function(data) {
+            updateStats(data);
+        },
+        crypto_update: function(data) {
+            // Real-time crypto price update from Redis hub
+            updateCryptoChartRealtime(data);
+        }
+    };
 
-    socket.on('crypto_update', function(data) {
-        // Real-time crypto price update from Redis hub
-        updateCryptoChartRealtime(data);
+    Object.entries(handlers).forEach(([event, handler]) => {
+        socket.on(`${event}_batch`, function(items) {
+            items.forEach(handler);
+        });
     });
 }
 
@@ -108,6 +114,43 @@ function updateConnectionStatus(connected) {
     }
 }
 
+// Fetch several GET endpoints in one request, resolves to {path: body}
+function fetchBatch(paths) {
+    return fetch('/api/batch', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(paths)
+    }).then(response => response.json());
+}
+
+// Load the panels whose URLs don't depend on filters in a single batch
+function loadInitialBatch() {
+    const panels = {
+        '/api/stats': updateStats,
+        '/api/alerts?limit=50': data => { alerts = data; displayAlerts(data); },
+        '/api/forex/calendar': data => displayForexCalendar(data.events || []),
+        '/api/visualizations/category-distribution': renderCategoryChart,
+        '/api/visualizations/crypto-chart': renderCryptoChart
+    };
+
+    fetchBatch(Object.keys(panels))
+        .then(results => {
+            Object.entries(panels).forEach(([path, render]) => {
+                if (results[path] && !results[path].error) {
+                    render(results[path]);
+                }
+            });
+        })
+        .catch(error => {
+            // Fall back to individual requests
+            loadStats();
+            loadAlerts();
+            loadForexCalendar();
+            loadCategoryChart();
+            loadCryptoChart();
+        });
+}
+
 // Load statistics
 function loadStats() {
     fetch('/api/stats')
@@ -805,6 +848,37 @@ function loadSentimentChart() {
         .catch(error => {});
 }
 
+// Fold one new sentiment score into the hourly sentiment chart without refetching it
+function applySentimentDelta(point) {
+    const chartDiv = document.getElementById('sentimentChart');
+    if (!chartDiv || !chartDiv.data || chartDiv.data.length === 0) {
+        return;
+    }
+    if (currentCategory !== 'all' && point.category !== currentCategory) {
+        return;
+    }
+
+    const trace = chartDiv.data[0];
+    const last = trace.x.length - 1;
+    const counts = trace.customdata || [];
+
+    // Points are hourly averages: same hour updates the last point, a new hour appends one
+    if (last >= 0 && String(trace.x[last]).slice(0, 13) === point.timestamp.slice(0, 13)) {
+        const count = counts[last] || 1;
+        const newY = [...trace.y];
+        const newCounts = [...counts];
+        newY[last] = (trace.y[last] * count + point.sentiment) / (count + 1);
+        newCounts[last] = count + 1;
+        Plotly.restyle(chartDiv, { y: [newY], customdata: [newCounts] }, 0);
+    } else if (last < 0 || point.timestamp > String(trace.x[last])) {
+        Plotly.extendTraces(chartDiv, {
+            x: [[point.timestamp]],
+            y: [[point.sentiment]],
+            customdata: [[1]]
+        }, [0]);
+    }
+}
+
 // Load word frequency chart (Top Keywords with dynamic time range)
 function loadWordFrequencyChart() {
     const category = currentCategory === 'all' ? '' : currentCategory;
@@ -1297,38 +1371,42 @@ function create24hTimelineGrid(data) {
 function loadCategoryChart() {
     fetch('/api/visualizations/category-distribution')
         .then(response => response.json())
-        .then(chartData => {
-            if (chartData.data && chartData.layout) {
-                Plotly.newPlot('categoryChart', chartData.data, {
-                    ...chartData.layout,
-                    paper_bgcolor: '#16181c',
-                    plot_bgcolor: '#16181c',
-                    font: { color: '#e7e9ea' }
-                }, { responsive: true });
-            }
-        })
+        .then(renderCategoryChart)
         .catch(error => {});
 }
 
+function renderCategoryChart(chartData) {
+    if (chartData.data && chartData.layout) {
+        Plotly.newPlot('categoryChart', chartData.data, {
+            ...chartData.layout,
+            paper_bgcolor: '#16181c',
+            plot_bgcolor: '#16181c',
+            font: { color: '#e7e9ea' }
+        }, { responsive: true });
+    }
+}
+
 // Load crypto price chart
 function loadCryptoChart() {
     fetch('/api/visualizations/crypto-chart')
         .then(response => response.json())
-        .then(chartData => {
-            if (chartData.data && chartData.layout) {
-                Plotly.newPlot('cryptoChart', chartData.data, {
-                    ...chartData.layout,
-                    paper_bgcolor: '#16181c',
-                    plot_bgcolor: '#16181c',
-                    font: { color: '#e7e9ea' },
-                    xaxis: { ...chartData.layout.xaxis, gridcolor: '#2f3336' },
-                    yaxis: { ...chartData.layout.yaxis, gridcolor: '#2f3336' }
-                }, { responsive: true });
-            }
-        })
+        .then(renderCryptoChart)
         .catch(error => {});
 }
 
+function renderCryptoChart(chartData) {
+    if (chartData.data && chartData.layout) {
+        Plotly.newPlot('cryptoChart', chartData.data, {
+            ...chartData.layout,
+            paper_bgcolor: '#16181c',
+            plot_bgcolor: '#16181c',
+            font: { color: '#e7e9ea' },
+            xaxis: { ...chartData.layout.xaxis, gridcolor: '#2f3336' },
+            yaxis: { ...chartData.layout.yaxis, gridcolor: '#2f3336' }
+        }, { responsive: true });
+    }
+}
+
 // Update crypto chart with real-time data (direct Plotly update)
 function updateCryptoChartRealtime(data) {
     // data contains: symbol, price, change_percent, baseline_price
@@ -1369,29 +1447,15 @@ function updateCryptoChartRealtime(data) {
         const newColors = [...trace.marker.color];
         newColors[barIndex] = color;
 
-        // Format price label based on magnitude
-        let priceLabel;
-        const changeSign = changePercent >= 0 ? '+' : '';
-        const changeStr = `${changeSign}${changePercent.toFixed(2)}%`;
-
-        if (price < 0.01) {
-            priceLabel = `$${price.toFixed(8)}\n${changeStr}`;
-        } else if (price < 1) {
-            priceLabel = `$${price.toFixed(6)}\n${changeStr}`;
-        } else if (price < 100) {
-            priceLabel = `$${price.toFixed(4)}\n${changeStr}`;
-        } else {
-            priceLabel = `$${price.toLocaleString('en-US', {minimumFractionDigits: 2, maximumFractionDigits: 2})}\n${changeStr}`;
-        }
-
-        const newText = [...trace.text];
-        newText[barIndex] = priceLabel;
+        // Labels come from the trace's texttemplate, which formats y and customdata (change %)
+        const newChanges = [...trace.customdata];
+        newChanges[barIndex] = changePercent || 0;
 
         // Update the trace using Plotly.restyle
         Plotly.restyle(chartDiv, {
             'y': [newY],
             'marker.color': [newColors],
-            'text': [newText]
+            'customdata': [newChanges]
         }, 0);
 
     } catch (error) {
@@ -1442,7 +1506,7 @@ function setupAdminButtons() {
             })
             .then(response => response.json())
             .then(data => {
-                if (data.status === 'success') {
+                if (data.status === 'accepted') {
                     // Show success message
                     this.innerHTML = '<svg width="16" height="16" fill="currentColor" viewBox="0 0 16 16" style="margin-right: 5px;"><path d="M10.97 4.97a.75.75 0 0 1 1.07 1.05l-3.99 4.99a.75.75 0 0 1-1.08.02L4.324 8.384a.75.75 0 1 1 1.06-1.06l2.094 2.093 3.473-4.425a.267.267 0 0 1 .02-.022z"/></svg>Refreshed!';
                     this.classList.add('btn-success');